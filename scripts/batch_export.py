@@ -9,10 +9,77 @@ Exports:
 - PNG frames (optional)
 """
 
+import atexit
+import copy
 import sys
 import json
 from pathlib import Path
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional - C-backed JSON, falls back to stdlib
+
+
+def _loads(raw: bytes):
+    """Parse JSON bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Import exporters directly - avoids interpreter startup + re-import of
+# lottie/PIL/cairo that a python3 subprocess would pay for every format.
+# The serializer comes from optimize_lottie too: optimize_lottie_data
+# leaves NumPy arrays in the tree, and only that _dumps knows how to
+# encode them (orjson's OPT_SERIALIZE_NUMPY / a .tolist() default)
+from optimize_lottie import optimize_lottie_data, _dumps
+from render_lottie import render_lottie_to_gif, render_lottie_to_mp4
+
+
+def _export_json(lottie_path: Path, data: dict, json_output: Path, optimize: bool) -> str:
+    """Export optimized (or copied) Lottie JSON. Returns output path."""
+    print(f"📦 Exporting optimized JSON...")
+
+    if optimize:
+        try:
+            optimized = optimize_lottie_data(data, decimal_places=2)
+            # One buffered write of pre-serialized bytes
+            json_output.write_bytes(_dumps(optimized))
+        except Exception as e:
+            raise RuntimeError(f"JSON optimization failed: {e}")
+    else:
+        # Just copy without optimization - copyfile uses in-kernel copy
+        # (sendfile/copy_file_range) on Linux, and we don't need the
+        # permission-copying that shutil.copy adds
+        import shutil
+        shutil.copyfile(lottie_path, json_output)
+
+    print(f"   ✓ JSON: {json_output}")
+    return str(json_output)
+
+
+def _export_gif(lottie_path: Path, data: dict, gif_output: Path) -> str:
+    """Export GIF preview. Returns output path."""
+    print(f"🎬 Exporting GIF...")
+
+    if not render_lottie_to_gif(lottie_path, gif_output, data=data):
+        raise RuntimeError("GIF render failed")
+
+    print(f"   ✓ GIF: {gif_output}")
+    return str(gif_output)
+
+
+def _export_mp4(lottie_path: Path, data: dict, mp4_output: Path) -> str:
+    """Export MP4 video. Returns output path."""
+    print(f"🎥 Exporting MP4...")
+
+    if not render_lottie_to_mp4(lottie_path, mp4_output, data=data):
+        raise RuntimeError("MP4 render failed (ffmpeg required)")
+
+    print(f"   ✓ MP4: {mp4_output}")
+    return str(mp4_output)
 
 
 def batch_export(
@@ -35,9 +102,6 @@ def batch_export(
     """
     lottie_path = Path(lottie_path)
 
-    if not lottie_path.exists():
-        return {'error': f'File not found: {lottie_path}'}
-
     if output_dir is None:
         output_dir = lottie_path.parent
     else:
@@ -55,93 +119,76 @@ def batch_export(
         'errors': []
     }
 
-    # Get script directory (same directory as this script)
-    script_dir = Path(__file__).parent
+    # Input problems report through results['errors'] like any export
+    # failure - callers (main() included) only know that shape
+    if not lottie_path.exists():
+        results['errors'].append(f'File not found: {lottie_path}')
+        return results
+
+    # Parse the Lottie JSON once - avoids each format re-reading and
+    # re-parsing the same file
+    try:
+        data = _loads(lottie_path.read_bytes())
+    except ValueError as e:
+        results['errors'].append(f'Invalid JSON: {e}')
+        return results
+
+    # Every exporter mutates the dict it receives (the optimizer rewrites
+    # values and drops keys in place; the renderers absolutize asset
+    # paths and cull invisible layers), so each task after the first gets
+    # its own deep copy. Copies are made here, before any worker thread
+    # starts - sharing one dict raced the exporters against each other
+    # and baked render-only edits into the exported JSON.
+    def _task_data() -> dict:
+        return copy.deepcopy(data) if tasks else data
+
+    # Build task list - each export is independent, so they can run in
+    # parallel (the heavy lifting happens in Cairo/ffmpeg, which release
+    # the GIL or run as subprocesses)
+    tasks = []
 
-    # Export optimized JSON
     if 'json' in formats:
         json_output = output_dir / f"{base_name}_optimized.json"
-        print(f"📦 Exporting optimized JSON...")
-
-        if optimize:
-            optimize_script = script_dir / 'optimize_lottie.py'
-            if optimize_script.exists():
-                try:
-                    subprocess.run(
-                        ['python3', str(optimize_script), str(lottie_path), str(json_output)],
-                        check=True,
-                        capture_output=True
-                    )
-                    results['exports']['json'] = str(json_output)
-                    print(f"   ✓ JSON: {json_output}")
-                except subprocess.CalledProcessError as e:
-                    error_msg = f"JSON optimization failed: {e.stderr.decode()}"
-                    results['errors'].append(error_msg)
-                    print(f"   ✗ {error_msg}")
-            else:
-                # Fallback: just copy
-                import shutil
-                shutil.copy(lottie_path, json_output)
-                results['exports']['json'] = str(json_output)
-        else:
-            # Just copy without optimization
-            import shutil
-            shutil.copy(lottie_path, json_output)
-            results['exports']['json'] = str(json_output)
-            print(f"   ✓ JSON: {json_output}")
-
-    # Export GIF
+        tasks.append(('json', _export_json, (lottie_path, _task_data(), json_output, optimize)))
+
     if 'gif' in formats:
         gif_output = output_dir / f"{base_name}.gif"
-        print(f"🎬 Exporting GIF...")
+        tasks.append(('gif', _export_gif, (lottie_path, _task_data(), gif_output)))
 
-        render_script = script_dir / 'render_lottie.py'
-        if render_script.exists():
-            try:
-                subprocess.run(
-                    ['python3', str(render_script), str(lottie_path), str(gif_output)],
-                    check=True,
-                    capture_output=True
-                )
-                results['exports']['gif'] = str(gif_output)
-                print(f"   ✓ GIF: {gif_output}")
-            except subprocess.CalledProcessError as e:
-                error_msg = f"GIF render failed: {e.stderr.decode()}"
-                results['errors'].append(error_msg)
-                print(f"   ✗ {error_msg}")
-        else:
-            error_msg = "render_lottie.py not found"
-            results['errors'].append(error_msg)
-            print(f"   ✗ {error_msg}")
-
-    # Export MP4
     if 'mp4' in formats:
         mp4_output = output_dir / f"{base_name}.mp4"
-        print(f"🎥 Exporting MP4...")
+        tasks.append(('mp4', _export_mp4, (lottie_path, _task_data(), mp4_output)))
+
+    if not tasks:
+        return results
+
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = {fmt: executor.submit(fn, *args) for fmt, fn, args in tasks}
 
-        render_script = script_dir / 'render_lottie.py'
-        if render_script.exists():
+        for fmt, future in futures.items():
             try:
-                subprocess.run(
-                    ['python3', str(render_script), str(lottie_path), str(mp4_output)],
-                    check=True,
-                    capture_output=True
-                )
-                results['exports']['mp4'] = str(mp4_output)
-                print(f"   ✓ MP4: {mp4_output}")
-            except subprocess.CalledProcessError as e:
-                error_msg = f"MP4 render failed (ffmpeg required): {e.stderr.decode()}"
+                results['exports'][fmt] = future.result()
+            except Exception as e:
+                error_msg = str(e)
                 results['errors'].append(error_msg)
                 print(f"   ✗ {error_msg}")
-        else:
-            error_msg = "render_lottie.py not found"
-            results['errors'].append(error_msg)
-            print(f"   ✗ {error_msg}")
 
     return results
 
 
+def _buffer_stdout():
+    """Block-buffer stdout when piped so many small prints become few syscalls."""
+    if not sys.stdout.isatty():
+        try:
+            sys.stdout.reconfigure(line_buffering=False, write_through=False)
+            atexit.register(sys.stdout.flush)
+        except (AttributeError, ValueError):
+            pass  # Non-reconfigurable stream (e.g. StringIO in tests)
+
+
 def main():
+    _buffer_stdout()
+
     if len(sys.argv) < 2:
         print("Usage: batch_export.py <animation.json> [output_dir] [formats]")
         print("\nBatch export Lottie animation to multiple formats")
@@ -10,11 +10,23 @@ Checks for:
 Run this after installation to verify setup.
 """
 
+import atexit
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+def _buffer_stdout():
+    """Block-buffer stdout when piped so many small prints become few syscalls."""
+    if not sys.stdout.isatty():
+        try:
+            sys.stdout.reconfigure(line_buffering=False, write_through=False)
+            atexit.register(sys.stdout.flush)
+        except (AttributeError, ValueError):
+            pass  # Non-reconfigurable stream (e.g. StringIO in tests)
+
+
 def check_python_package(package_name: str, import_name: str = None) -> bool:
     """Check if a Python package is installed and importable."""
     if import_name is None:
@@ -83,8 +95,13 @@ def check_lottie_library() -> bool:
     return all_ok
 
 
-def check_system_command(command: str, package_name: str = None, install_hint: str = None) -> bool:
-    """Check if a system command is available."""
+def check_system_command(command: str, package_name: str = None, install_hint: str = None) -> tuple[bool, list[str]]:
+    """
+    Check if a system command is available.
+
+    Returns (ok, report_lines) instead of printing directly so probes can
+    run concurrently and still report in a deterministic order.
+    """
     if package_name is None:
         package_name = command
 
@@ -96,18 +113,19 @@ def check_system_command(command: str, package_name: str = None, install_hint: s
             timeout=5
         )
         if result.returncode == 0:
-            print(f"✅ {package_name}: Installed")
-            return True
+            return True, [f"✅ {package_name}: Installed"]
     except (FileNotFoundError, subprocess.TimeoutExpired):
         pass
 
-    print(f"⚠️  {package_name}: NOT installed")
+    lines = [f"⚠️  {package_name}: NOT installed"]
     if install_hint:
-        print(f"   {install_hint}")
-    return False
+        lines.append(f"   {install_hint}")
+    return False, lines
 
 
 def main():
+    _buffer_stdout()
+
     print("🔍 Wiggle Skill Dependency Checker\n")
 
     print("=" * 60)
@@ -130,19 +148,26 @@ def main():
 
     print("\n🔧 System Tools:")
 
-    # FFmpeg for MP4
-    check_system_command(
-        "ffmpeg",
-        "ffmpeg (for MP4 export)",
-        "macOS: brew install ffmpeg | Linux: sudo apt-get install ffmpeg"
-    )
-
-    # Potrace for PNG→SVG
-    check_system_command(
-        "potrace",
-        "potrace (for PNG→SVG conversion)",
-        "macOS: brew install potrace | Linux: sudo apt-get install potrace"
-    )
+    # Each probe forks a subprocess with a 5s timeout, so run them
+    # concurrently and print collected reports in a fixed order.
+    # (Python imports above stay single-threaded - some touch global state.)
+    probes = [
+        # FFmpeg for MP4
+        ("ffmpeg",
+         "ffmpeg (for MP4 export)",
+         "macOS: brew install ffmpeg | Linux: sudo apt-get install ffmpeg"),
+        # Potrace for PNG→SVG
+        ("potrace",
+         "potrace (for PNG→SVG conversion)",
+         "macOS: brew install potrace | Linux: sudo apt-get install potrace"),
+    ]
+
+    with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+        futures = [executor.submit(check_system_command, *probe) for probe in probes]
+        for future in futures:
+            _, lines = future.result()
+            for line in lines:
+                print(line)
 
     print("\n" + "=" * 60)
     print("SUMMARY")
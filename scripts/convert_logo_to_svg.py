@@ -8,12 +8,92 @@ This is useful for Lottie animations which work better with vector graphics.
 Requires: potrace (install via: brew install potrace / apt-get install potrace)
 """
 
+import functools
+import shutil
 import sys
 import subprocess
+import threading
+from io import BytesIO
 from pathlib import Path
 from PIL import Image
 
 
+@functools.lru_cache(maxsize=1)
+def _potrace_path() -> str | None:
+    """Locate potrace once per process (PATH lookup, no subprocess)."""
+    return shutil.which('potrace')
+
+
+def run_capturing_tail(cmd: list[str], input_bytes: bytes = None, tail: int = 4096) -> tuple[int, bytes]:
+    """
+    Run a command, discarding stdout and keeping only the last `tail` bytes
+    of stderr. Unlike capture_output=True this bounds memory even if the
+    tool emits megabytes of progress text.
+
+    Returns (returncode, stderr_tail).
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE if input_bytes is not None else None,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+
+    writer = None
+    if input_bytes is not None:
+        # Feed stdin from a thread so a chatty stderr can't deadlock us
+        def _feed():
+            try:
+                proc.stdin.write(input_bytes)
+            except BrokenPipeError:
+                pass
+            finally:
+                proc.stdin.close()
+
+        writer = threading.Thread(target=_feed)
+        writer.start()
+
+    stderr_tail = b''
+    for chunk in iter(lambda: proc.stderr.read(65536), b''):
+        stderr_tail = (stderr_tail + chunk)[-tail:]
+    proc.stderr.close()
+
+    if writer is not None:
+        writer.join()
+
+    return proc.wait(), stderr_tail
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Optional - enables the vectorized threshold fast path
+
+
+def image_to_pbm_bytes(img: Image.Image, threshold: int) -> bytes:
+    """
+    Threshold an image and encode it as 1-bit PBM (P4) bytes for potrace.
+
+    With NumPy available, the compare + bit-packing runs as two vectorized
+    C loops; otherwise falls back to PIL's per-pixel point table.
+    """
+    if img.mode != 'L':
+        img = img.convert('L')
+
+    if np is not None:
+        arr = np.asarray(img)
+        # PBM convention: 1 = black, so dark pixels (<= threshold) are set
+        bits = (arr <= threshold).astype(np.uint8)
+        packed = np.packbits(bits, axis=1)
+        width, height = img.size
+        return b'P4\n%d %d\n' % (width, height) + packed.tobytes()
+
+    # Fallback: PIL threshold + PBM encode (mode '1' saves as PBM)
+    bw = img.point(lambda x: 255 if x > threshold else 0, mode='1')
+    buffer = BytesIO()
+    bw.save(buffer, format='PPM')
+    return buffer.getvalue()
+
+
 def convert_logo_to_svg(
     input_path: str | Path,
     output_path: str | Path = None,
@@ -43,10 +123,8 @@ def convert_logo_to_svg(
     else:
         output_path = Path(output_path)
 
-    # Check if potrace is installed
-    try:
-        subprocess.run(['potrace', '--version'], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    # Check if potrace is installed (cached - one lookup per process)
+    if not _potrace_path():
         print("❌ Error: potrace is not installed")
         print("   Install with:")
         print("     macOS: brew install potrace")
@@ -59,30 +137,24 @@ def convert_logo_to_svg(
         print(f"📖 Loading image: {input_path}")
         img = Image.open(input_path)
 
-        # Convert to grayscale
-        if img.mode != 'L':
-            img = img.convert('L')
-
-        # Apply threshold to create binary image
-        img = img.point(lambda x: 255 if x > threshold else 0, mode='1')
-
-        # Save as PBM
-        pbm_path = input_path.with_suffix('.pbm')
-        img.save(pbm_path)
-        print(f"✓ Created bitmap: {pbm_path}")
+        # Threshold to a 1-bit bitmap and encode as PBM in one pass
+        pbm_bytes = image_to_pbm_bytes(img, threshold)
 
         # Step 2: Trace bitmap to SVG using potrace
+        # Feed the PBM through stdin ('-') - no temp file on disk
         print(f"🎨 Tracing to SVG...")
 
-        potrace_cmd = ['potrace', str(pbm_path), '-s', '-o', str(output_path)]
+        potrace_cmd = ['potrace', '-', '-s', '-o', str(output_path)]
 
         if optimize:
             potrace_cmd.extend(['-O', '0.2'])  # Optimization tolerance
 
-        subprocess.run(potrace_cmd, check=True, capture_output=True)
-
-        # Cleanup temporary PBM
-        pbm_path.unlink()
+        returncode, stderr_tail = run_capturing_tail(potrace_cmd, input_bytes=pbm_bytes)
+        if returncode != 0:
+            raise RuntimeError(
+                f"potrace exited with {returncode}: "
+                f"{stderr_tail.decode(errors='replace').strip()}"
+            )
 
         # Check output
         if output_path.exists():
@@ -96,30 +168,86 @@ def convert_logo_to_svg(
 
     except Exception as e:
         print(f"❌ Error during conversion: {e}")
-        # Cleanup on error
-        if pbm_path and pbm_path.exists():
-            pbm_path.unlink()
         return False, ""
 
 
+def convert_batch(input_paths: list[Path], jobs: int = None) -> int:
+    """
+    Convert many logos using a pool of worker processes.
+
+    Each worker imports PIL once and handles several images, amortizing
+    interpreter/library startup across the batch. Returns the number of
+    failed conversions.
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = jobs or min(os.cpu_count() or 1, len(input_paths))
+    print(f"🚀 Batch converting {len(input_paths)} logo(s) with {workers} worker(s)\n")
+
+    failures = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [(path, executor.submit(convert_logo_to_svg, path))
+                   for path in input_paths]
+        for path, future in futures:
+            success, _ = future.result()
+            if not success:
+                failures += 1
+
+    print(f"\n✅ Converted {len(input_paths) - failures}/{len(input_paths)} logo(s)")
+    return failures
+
+
 def main():
-    if len(sys.argv) < 2:
+    argv = sys.argv[1:]
+
+    # Batch mode is explicit: --batch, or --jobs N (which implies it).
+    # It used to be inferred from every argument naming an existing
+    # file, which hijacked the documented `input.png output.svg` form
+    # as soon as the output SVG existed from a previous run.
+    batch = '--batch' in argv
+    if batch:
+        argv.remove('--batch')
+
+    jobs = None
+    if '--jobs' in argv:
+        i = argv.index('--jobs')
+        try:
+            jobs = int(argv[i + 1])
+        except (IndexError, ValueError):
+            print("❌ Error: --jobs requires a number")
+            sys.exit(1)
+        del argv[i:i + 2]
+        batch = True
+
+    if not argv:
         print("Usage: convert_logo_to_svg.py <input.png|jpg> [output.svg] [threshold]")
+        print("       convert_logo_to_svg.py --batch <input1.png> <input2.png> ... [--jobs N]")
         print("\nConvert raster logo to vector SVG using image tracing")
         print("\nExamples:")
         print("  convert_logo_to_svg.py logo.png")
         print("  convert_logo_to_svg.py logo.png logo_vector.svg")
         print("  convert_logo_to_svg.py logo.png logo.svg 150")
+        print("  convert_logo_to_svg.py --batch *.png --jobs 4")
         print("\nOptional:")
         print("  output.svg: Output path (default: same name with .svg)")
         print("  threshold: Bitmap threshold 0-255 (default: 128)")
         print("             Lower = more black, Higher = more white")
+        print("  --batch: Treat every argument as an input and convert in parallel")
+        print("  --jobs N: Worker processes for batch mode, implies --batch (default: CPU count)")
         print("\nRequires: potrace (brew install potrace)")
         sys.exit(1)
 
-    input_path = sys.argv[1]
-    output_path = sys.argv[2] if len(sys.argv) > 2 else None
-    threshold = int(sys.argv[3]) if len(sys.argv) > 3 else 128
+    # Batch mode: every argument is an input, converted in parallel
+    if batch:
+        failures = convert_batch([Path(a) for a in argv], jobs)
+        if failures:
+            sys.exit(1)
+        return
+
+    input_path = argv[0]
+    output_path = argv[1] if len(argv) > 1 else None
+    threshold = int(argv[2]) if len(argv) > 2 else 128
 
     print(f"🚀 Converting logo to SVG")
     print(f"   Input: {input_path}")
@@ -38,16 +38,105 @@ Example Workflow:
 
 import xml.etree.ElementTree as ET
 import argparse
+import copy
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
 import re
 
+# Strips unit suffixes (px, pt, etc.) from width/height values
+_UNIT_RE = re.compile(r'[^\d.]')
 
-def parse_svg(svg_path):
-    """Parse SVG file and return element tree."""
+
+# An SVG reuses the same handful of namespaced tag strings, so memoizing
+# the localname beats re-slicing the string for every element
+_LOCALNAME = {}
+
+
+def localname(tag):
+    """Return the tag name without its namespace prefix (memoized)."""
+    result = _LOCALNAME.get(tag)
+    if result is None:
+        result = tag.rpartition('}')[2] if isinstance(tag, str) else ''
+        _LOCALNAME[tag] = result
+    return result
+
+
+def _strip_unit(value):
+    """Strip a unit suffix from a dimension, skipping the regex when the
+    value is already a plain number (the common case)."""
+    value = str(value)
     try:
-        tree = ET.parse(svg_path)
-        return tree
+        float(value)
+        return value
+    except ValueError:
+        return _UNIT_RE.sub('', value)
+
+
+def scan_svg(svg_path, split_letters=False, paths_only=False, groups_only=False,
+             keep_elems=True):
+    """
+    Scan an SVG in a single streaming pass and collect extractable elements.
+
+    Uses ET.iterparse so paths, groups and text elements are classified in
+    one traversal instead of three separate findall() walks. Returns
+    parallel lists (structure-of-arrays) to keep per-element overhead low:
+
+        (root, types, ids, elems)
+
+    where types[i]/ids[i]/elems[i] describe the i-th element in document
+    order.
+
+    With keep_elems=False (listing mode), elements are cleared as soon as
+    they have been classified, so memory stays bounded even for multi-MB
+    traced SVGs; elems comes back as None.
+    """
+    types = []
+    ids = []
+    elems = []
+    root = None
+    counts = {'path': 0, 'g': 0, 'text': 0}
+
+    try:
+        for event, el in ET.iterparse(svg_path, events=('start', 'end')):
+            if event == 'start':
+                if root is None:
+                    root = el
+                continue
+
+            # Strip namespace to classify by localname
+            tag = localname(el.tag)
+
+            if tag == 'path' and not groups_only:
+                types.append('path')
+                ids.append(el.get('id', f"path_{counts['path']}"))
+                elems.append(el)
+                counts['path'] += 1
+            elif tag == 'g' and not paths_only:
+                types.append('group')
+                ids.append(el.get('id', f"group_{counts['g']}"))
+                elems.append(el)
+                counts['g'] += 1
+            elif tag == 'text' and not paths_only:
+                i = counts['text']
+                if split_letters:
+                    # Extract individual letters (simplified - in production, use path splitting)
+                    text_content = el.text or ''
+                    for j, letter in enumerate(text_content):
+                        types.append('text_letter')
+                        ids.append(f'letter_{letter.lower()}_{i}_{j}')
+                        elems.append(el)
+                else:
+                    types.append('text')
+                    ids.append(el.get('id', f'text_{i}'))
+                    elems.append(el)
+                counts['text'] += 1
+
+            if not keep_elems and el is not root:
+                # Listing mode: drop attributes/children as we go so the
+                # tree never materializes (root keeps its viewBox attrs)
+                el.clear()
     except ET.ParseError as e:
         print(f"❌ Error parsing SVG: {e}")
         sys.exit(1)
@@ -55,6 +144,8 @@ def parse_svg(svg_path):
         print(f"❌ Error: File not found: {svg_path}")
         sys.exit(1)
 
+    return root, types, ids, (elems if keep_elems else None)
+
 
 def get_viewbox(root):
     """Extract viewBox from SVG root element."""
@@ -67,8 +158,8 @@ def get_viewbox(root):
     height = root.get('height', '100')
 
     # Remove units (px, pt, etc.)
-    width = re.sub(r'[^\d.]', '', str(width))
-    height = re.sub(r'[^\d.]', '', str(height))
+    width = _strip_unit(width)
+    height = _strip_unit(height)
 
     return f"0 0 {width} {height}"
 
@@ -84,91 +175,7 @@ def calculate_bbox(element, namespace=''):
     return "0 0 100 100"
 
 
-def extract_paths(root, namespace=''):
-    """Extract all <path> elements from SVG."""
-    paths = []
-    ns = {'svg': namespace} if namespace else None
-
-    # Find all path elements
-    if namespace:
-        path_elements = root.findall('.//svg:path', ns)
-    else:
-        path_elements = root.findall('.//{http://www.w3.org/2000/svg}path')
-        if not path_elements:
-            path_elements = root.findall('.//path')
-
-    for i, path in enumerate(path_elements):
-        paths.append({
-            'type': 'path',
-            'index': i,
-            'element': path,
-            'id': path.get('id', f'path_{i}')
-        })
-
-    return paths
-
-
-def extract_groups(root, namespace=''):
-    """Extract all <g> group elements from SVG."""
-    groups = []
-    ns = {'svg': namespace} if namespace else None
-
-    # Find all group elements
-    if namespace:
-        group_elements = root.findall('.//svg:g', ns)
-    else:
-        group_elements = root.findall('.//{http://www.w3.org/2000/svg}g')
-        if not group_elements:
-            group_elements = root.findall('.//g')
-
-    for i, group in enumerate(group_elements):
-        groups.append({
-            'type': 'group',
-            'index': i,
-            'element': group,
-            'id': group.get('id', f'group_{i}')
-        })
-
-    return groups
-
-
-def extract_text_elements(root, namespace='', split_letters=False):
-    """Extract all <text> elements from SVG."""
-    texts = []
-    ns = {'svg': namespace} if namespace else None
-
-    # Find all text elements
-    if namespace:
-        text_elements = root.findall('.//svg:text', ns)
-    else:
-        text_elements = root.findall('.//{http://www.w3.org/2000/svg}text')
-        if not text_elements:
-            text_elements = root.findall('.//text')
-
-    for i, text in enumerate(text_elements):
-        if split_letters:
-            # Extract individual letters (simplified - in production, use path splitting)
-            text_content = text.text or ''
-            for j, letter in enumerate(text_content):
-                texts.append({
-                    'type': 'text_letter',
-                    'index': f'{i}_{j}',
-                    'element': text,
-                    'id': f'letter_{letter.lower()}_{i}_{j}',
-                    'letter': letter
-                })
-        else:
-            texts.append({
-                'type': 'text',
-                'index': i,
-                'element': text,
-                'id': text.get('id', f'text_{i}')
-            })
-
-    return texts
-
-
-def create_element_svg(element_data, original_viewbox, original_root):
+def create_element_svg(element, original_viewbox, original_root):
     """Create a new SVG containing just the extracted element."""
     # Create new SVG root
     svg_attrs = {
@@ -185,25 +192,34 @@ def create_element_svg(element_data, original_viewbox, original_root):
 
     new_svg = ET.Element('svg', svg_attrs)
 
-    # Copy the element (deep copy to preserve children)
-    element_copy = ET.fromstring(ET.tostring(element_data['element']))
+    # Copy the element (deep copy to preserve children) - avoids the
+    # serialize/re-parse round-trip of ET.fromstring(ET.tostring(...))
+    element_copy = copy.deepcopy(element)
     new_svg.append(element_copy)
 
     return new_svg
 
 
-def save_element_svg(element_svg, output_path):
-    """Save element SVG to file."""
+def save_element_svg(element_svg, output_path, pretty=False):
+    """Save element SVG to file. Returns bytes written, or None on error."""
     # Create XML declaration and save
     tree = ET.ElementTree(element_svg)
-    ET.indent(tree, space='  ')  # Pretty print (Python 3.9+)
+    if pretty:
+        # Pretty print (Python 3.9+) - opt-in, since extracted SVGs are
+        # machine-consumed intermediates and the indent walk is O(n)
+        ET.indent(tree, space='  ')
 
     try:
-        tree.write(output_path, encoding='utf-8', xml_declaration=True)
-        return True
+        # Serialize once in memory; the buffer length doubles as the
+        # file size, so callers don't need a follow-up stat()
+        buffer = BytesIO()
+        tree.write(buffer, encoding='utf-8', xml_declaration=True)
+        data = buffer.getvalue()
+        Path(output_path).write_bytes(data)
+        return len(data)
     except Exception as e:
         print(f"❌ Error saving {output_path}: {e}")
-        return False
+        return None
 
 
 def main():
@@ -230,50 +246,43 @@ Examples:
     parser.add_argument('--output-dir', '-o', help='Output directory for extracted elements', default='./elements/')
     parser.add_argument('--list-only', '-l', action='store_true', help='List elements without extracting')
     parser.add_argument('--split-text-letters', action='store_true', help='Split text elements into individual letters')
+    parser.add_argument('--pretty', action='store_true', help='Pretty-print extracted SVGs (slower, larger files)')
     parser.add_argument('--paths-only', action='store_true', help='Extract only path elements')
     parser.add_argument('--groups-only', action='store_true', help='Extract only group elements')
 
     args = parser.parse_args()
 
-    # Parse SVG
+    # Parse SVG in a single streaming pass
     print(f"📖 Parsing SVG: {args.input_svg}")
-    tree = parse_svg(args.input_svg)
-    root = tree.getroot()
+    root, types, ids, elems = scan_svg(
+        args.input_svg,
+        split_letters=args.split_text_letters,
+        paths_only=args.paths_only,
+        groups_only=args.groups_only,
+        keep_elems=not args.list_only
+    )
 
     # Get viewBox
     viewbox = get_viewbox(root)
     print(f"   ViewBox: {viewbox}")
 
-    # Extract elements
-    all_elements = []
-
-    if not args.groups_only:
-        paths = extract_paths(root)
-        all_elements.extend(paths)
-        print(f"   Found {len(paths)} path element(s)")
-
+    total = len(types)
+    print(f"   Found {types.count('path')} path element(s)")
     if not args.paths_only:
-        groups = extract_groups(root)
-        all_elements.extend(groups)
-        print(f"   Found {len(groups)} group element(s)")
-
-        texts = extract_text_elements(root, split_letters=args.split_text_letters)
-        all_elements.extend(texts)
+        print(f"   Found {types.count('group')} group element(s)")
         if args.split_text_letters:
-            print(f"   Found {len(texts)} text letter(s)")
+            print(f"   Found {types.count('text_letter')} text letter(s)")
         else:
-            print(f"   Found {len(texts)} text element(s)")
+            print(f"   Found {types.count('text')} text element(s)")
 
-    if not all_elements:
+    if not total:
         print("⚠️  No elements found to extract")
         sys.exit(0)
 
     # List-only mode
     if args.list_only:
-        print(f"\n📋 Elements found ({len(all_elements)} total):\n")
-        for elem in all_elements:
-            elem_type = elem['type']
-            elem_id = elem['id']
+        print(f"\n📋 Elements found ({total} total):\n")
+        for elem_type, elem_id in zip(types, ids):
             print(f"   - {elem_type}: {elem_id}")
 
         print(f"\n💡 To extract, run:")
@@ -285,24 +294,29 @@ Examples:
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Extract elements
-    print(f"\n🔍 Extracting {len(all_elements)} element(s) to {args.output_dir}")
+    print(f"\n🔍 Extracting {total} element(s) to {args.output_dir}")
     extracted_count = 0
 
-    for elem in all_elements:
-        # Create element SVG
-        element_svg = create_element_svg(elem, viewbox, root)
-
-        # Generate output filename
-        elem_id = elem['id'].replace(' ', '_').replace('/', '_')
+    def _extract_one(elem_type, elem_id, element):
+        """Build and save one element SVG. Returns (bytes_written, type, filename)."""
+        element_svg = create_element_svg(element, viewbox, root)
+        elem_id = elem_id.replace(' ', '_').replace('/', '_')
         output_file = output_dir / f"{elem_id}.svg"
+        return save_element_svg(element_svg, output_file, pretty=args.pretty), elem_type, output_file
+
+    # File writes are I/O-bound, so overlap them with a thread pool
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(_extract_one, t, i, e)
+                   for t, i, e in zip(types, ids, elems)]
 
-        # Save
-        if save_element_svg(element_svg, output_file):
-            file_size = output_file.stat().st_size
-            print(f"   ✅ {elem['type']}: {output_file.name} ({file_size} bytes)")
-            extracted_count += 1
+        # Report in submission order for deterministic output
+        for future in futures:
+            file_size, elem_type, output_file = future.result()
+            if file_size is not None:
+                print(f"   ✅ {elem_type}: {output_file.name} ({file_size} bytes)")
+                extracted_count += 1
 
-    print(f"\n✅ Extracted {extracted_count}/{len(all_elements)} elements successfully")
+    print(f"\n✅ Extracted {extracted_count}/{total} elements successfully")
     print(f"\n📁 Output directory: {output_dir.absolute()}")
 
     # Next steps guidance
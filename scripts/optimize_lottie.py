@@ -11,10 +11,61 @@ Optimizations:
 """
 
 import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None  # Optional - fastest decoder of the bunch
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional - C-backed JSON, falls back to stdlib
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Optional - vectorizes rounding of keyframe arrays
+
+try:
+    import ijson
+except ImportError:
+    ijson = None  # Optional - streams huge files one layer at a time
+
+# Files at least this big take the streaming path when ijson is available
+_STREAMING_THRESHOLD = 5 * 1024 * 1024
+
+
+def _loads(raw: bytes):
+    """Parse JSON bytes with the fastest decoder available.
+
+    Preference order: msgspec > orjson > stdlib. Encoding stays on
+    orjson (see _dumps) since it can serialize NumPy arrays directly.
+    """
+    if msgspec is not None:
+        return msgspec.json.decode(raw)
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data) -> bytes:
+    """Serialize to minified JSON bytes with orjson when available."""
+    if orjson is not None:
+        if np is not None:
+            return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+        return orjson.dumps(data)
+    # Stdlib fallback; .tolist() covers any NumPy arrays in the tree
+    return json.dumps(
+        data, separators=(',', ':'),
+        default=lambda o: o.tolist()
+    ).encode('utf-8')
+
 
 def optimize_lottie(
     input_path: str | Path,
@@ -45,27 +96,21 @@ def optimize_lottie(
         output_path = Path(output_path)
 
     try:
-        # Load Lottie JSON
-        with open(input_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
         original_size = input_path.stat().st_size
 
-        # Optimization 1: Remove metadata
-        if remove_metadata:
-            # Remove non-essential metadata
-            for key in ['meta', 'metadata', 'description', 'generator', 'keywords']:
-                data.pop(key, None)
-
-        # Optimization 2: Round numeric values
-        data = _round_values(data, decimal_places)
+        if ijson is not None and original_size >= _STREAMING_THRESHOLD:
+            # Huge file: stream it layer by layer to cap peak memory
+            _optimize_streaming(
+                input_path, output_path, decimal_places, remove_metadata
+            )
+        else:
+            # Load Lottie JSON (raw bytes - the parser validates UTF-8)
+            data = _loads(input_path.read_bytes())
 
-        # Optimization 3: Remove empty arrays/objects
-        data = _remove_empty(data)
+            data = optimize_lottie_data(data, decimal_places, remove_metadata)
 
-        # Save optimized JSON (minified)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, separators=(',', ':'))
+            # Save optimized JSON (minified, one buffered write)
+            output_path.write_bytes(_dumps(data))
 
         optimized_size = output_path.stat().st_size
         reduction = original_size - optimized_size
@@ -84,35 +129,211 @@ def optimize_lottie(
         return False, {'error': str(e)}
 
 
-def _round_values(obj: Any, decimal_places: int) -> Any:
-    """Recursively round all numeric values in a data structure."""
-    if isinstance(obj, dict):
-        return {k: _round_values(v, decimal_places) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [_round_values(item, decimal_places) for item in obj]
-    elif isinstance(obj, float):
-        return round(obj, decimal_places)
-    else:
-        return obj
-
-
-def _remove_empty(obj: Any) -> Any:
-    """Recursively remove empty arrays and objects."""
-    if isinstance(obj, dict):
-        cleaned = {}
-        for k, v in obj.items():
-            cleaned_v = _remove_empty(v)
-            # Keep value if it's not an empty container
-            if cleaned_v is not None and cleaned_v != {} and cleaned_v != []:
-                cleaned[k] = cleaned_v
-            # Keep boolean False and 0
-            elif cleaned_v is False or cleaned_v == 0:
-                cleaned[k] = cleaned_v
-        return cleaned
-    elif isinstance(obj, list):
-        return [_remove_empty(item) for item in obj if item is not None]
-    else:
-        return obj
+def optimize_lottie_data(
+    data: dict,
+    decimal_places: int = 2,
+    remove_metadata: bool = True
+) -> dict:
+    """
+    Optimize an already-parsed Lottie dict (no file I/O).
+
+    Useful when the caller has the JSON in memory already (e.g. batch
+    export) and wants to avoid a redundant parse.
+    """
+    # Layers are independent subtrees, so when there are enough of them
+    # transform each on its own worker thread (the vectorized rounding
+    # releases the GIL inside NumPy) while the main thread does the rest
+    layers = data.get('layers') if type(data) is dict else None
+    if layers and len(layers) >= 4:
+        del data['layers']  # transformed per-layer below, then restored
+        data = _transform(data, decimal_places, remove_metadata)
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(
+                lambda layer: _transform(layer, decimal_places, remove_metadata),
+                layers
+            ))
+        data['layers'] = layers
+        return data
+
+    # Single fused pass: strip metadata, round values, prune empties
+    return _transform(data, decimal_places, remove_metadata)
+
+
+def _round_array(values: list, decimal_places: int):
+    """
+    Vectorized round for a homogeneous numeric list, or None when the fast
+    path doesn't apply.
+
+    All-int lists are left alone - they are already exact, and rounding
+    would only inflate [0, 100] into [0.0, 100.0]. For float lists the
+    float16 cast collapses the mantissa so the rounded values print with
+    fewer digits (and gzip better), a ~0.05% relative error that is safe
+    for 0-1 color values and small coordinates. It is skipped once any
+    magnitude exceeds 256: float16 spacing reaches 0.25 there (visible
+    drift on HD-comp coordinates) and overflows to inf past 65504.
+    """
+    if np is None or not values:
+        return None
+    has_float = False
+    for v in values:
+        t = type(v)
+        if t is float:
+            has_float = True
+        elif t is not int:
+            return None
+    if not has_float:
+        return None
+    arr = np.asarray(values, dtype=np.float32)
+    if np.abs(arr).max() <= 256.0:
+        arr = arr.astype(np.float16).astype(np.float32)
+    # Final round in float64: rounding in float32 leaves values like
+    # 100.12000274658203 that the stdlib _dumps fallback (.tolist())
+    # serializes at full double precision, defeating decimal_places
+    return np.round(arr.astype(np.float64), decimal_places)
+
+
+def _optimize_streaming(
+    input_path: Path,
+    output_path: Path,
+    decimal_places: int,
+    remove_metadata: bool
+) -> None:
+    """
+    Optimize a large Lottie file without materializing the whole DOM.
+
+    Layers dominate the size of big exports, so each layer is built,
+    transformed and written out individually as ijson streams the file;
+    the remaining top-level keys (small by comparison) are collected
+    into one dict. Peak memory is bounded by the largest single layer
+    instead of the full file.
+
+    Writes to a sibling temp file and replaces the output atomically,
+    so optimizing a file onto itself is safe.
+    """
+    import os
+
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    header_builder = ijson.ObjectBuilder()
+    layer_builder = None
+    wrote_layer = False
+
+    try:
+        with open(input_path, 'rb') as src, open(tmp_path, 'wb') as dst:
+            dst.write(b'{"layers":[')
+            # use_float=True: without it ijson yields non-integer numbers
+            # as decimal.Decimal, which _transform's type(x) is float
+            # dispatch never rounds and _dumps cannot serialize
+            for prefix, event, value in ijson.parse(src, use_float=True):
+                if prefix == '' and event == 'map_key' and value == 'layers':
+                    continue  # key is emitted by hand above
+                if prefix == 'layers':
+                    continue  # the array's own start/end events
+                if prefix.startswith('layers.'):
+                    if prefix == 'layers.item' and event == 'start_map':
+                        layer_builder = ijson.ObjectBuilder()
+                    layer_builder.event(event, value)
+                    if prefix == 'layers.item' and event == 'end_map':
+                        layer = _transform(
+                            layer_builder.value, decimal_places, remove_metadata
+                        )
+                        layer_builder = None
+                        if wrote_layer:
+                            dst.write(b',')
+                        dst.write(_dumps(layer))
+                        wrote_layer = True
+                else:
+                    header_builder.event(event, value)
+
+            header = _transform(
+                header_builder.value, decimal_places, remove_metadata
+            )
+            rest = _dumps(header)
+            if rest == b'{}':
+                dst.write(b']}')
+            else:
+                dst.write(b'],' + rest[1:])
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+# Non-essential metadata keys stripped during optimization
+_METADATA_KEYS = ('meta', 'metadata', 'description', 'generator', 'keywords')
+
+
+def _is_empty_value(value: Any) -> bool:
+    """True for values _transform prunes: None and empty dicts/lists."""
+    return value is None or (
+        type(value) in (dict, list) and not value
+    )
+
+
+def _transform(obj: Any, decimal_places: int, remove_metadata: bool) -> Any:
+    """
+    Optimize the tree in a single fused traversal, mutating it in place.
+
+    One downward pass strips metadata keys (at any depth, so nested
+    "meta" blocks go too), rounds floats and records the containers in
+    parents-first order; one reverse pass then prunes empties children-
+    before-parents, so a dict left empty by its children's removal is
+    itself dropped from its parent. Fusing the three former passes means
+    each node is touched twice total instead of twice per pass.
+    """
+    # Rounding callable specialized on the (per-invocation constant)
+    # precision: multiply-and-truncate against a pre-bound scale is
+    # cheaper than the generic round(x, n) builtin in this hot loop
+    scale = 10.0 ** decimal_places
+
+    def _round_fast(x: float) -> float:
+        return int(x * scale + (0.5 if x >= 0.0 else -0.5)) / scale
+
+    # Dispatch on type() identity rather than isinstance: JSON decoding
+    # guarantees exact builtin types (never subclasses), and skipping
+    # the MRO walk is measurable across millions of nodes
+    if type(obj) not in (dict, list):
+        return _round_fast(obj) if type(obj) is float else obj
+
+    order = []
+    stack = [obj]
+    push = stack.append
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        if type(node) is dict:
+            if remove_metadata:
+                for key in _METADATA_KEYS:
+                    node.pop(key, None)
+            items = node.items()
+        else:
+            items = enumerate(node)
+        for key, value in items:
+            t = type(value)
+            if t is float:
+                node[key] = _round_fast(value)
+            elif t is list:
+                rounded = _round_array(value, decimal_places)
+                if rounded is not None:
+                    node[key] = rounded
+                else:
+                    push(value)
+            elif t is dict:
+                push(value)
+
+    for node in reversed(order):
+        if type(node) is dict:
+            # Note: all-zero arrays are NOT pruned - zero scale, opacity
+            # and color values are meaningful (hidden layers, transparent
+            # fills), not noise. _is_empty_value never touches ndarrays,
+            # so the elementwise-truthiness pitfall doesn't arise here.
+            empty_keys = [k for k, v in node.items() if _is_empty_value(v)]
+            for k in empty_keys:
+                del node[k]
+        else:
+            # Lists only drop None entries (empty child dicts are kept,
+            # matching the original recursive behavior)
+            node[:] = [item for item in node if item is not None]
+    return obj
 
 
 def main():
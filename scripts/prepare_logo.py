@@ -18,32 +18,81 @@ Usage:
 
 import sys
 import argparse
-import base64
+import binascii
+import functools
+import shutil
+import subprocess
 from pathlib import Path
 from typing import Dict
 
-try:
-    from PIL import Image
-except ImportError:
-    print("❌ Error: Pillow not installed")
-    print("   Install with: pip install pillow")
-    sys.exit(1)
+@functools.lru_cache(maxsize=1)
+def _load_pil():
+    """
+    Import PIL on first use.
+
+    Importing Pillow pulls in several MB of C extensions, so deferring
+    it keeps this module cheap to import transitively (e.g. from batch
+    scripts) and speeds up --help and argument errors.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        print("❌ Error: Pillow not installed")
+        print("   Install with: pip install pillow")
+        sys.exit(1)
+    return Image
 
 
-def check_image_properties(img: Image.Image, filepath: Path) -> Dict:
-    """Analyze image and return property report."""
+@functools.lru_cache(maxsize=1)
+def _oxipng_path() -> str:
+    """Locate oxipng once per process (optional PNG recompressor)."""
+    return shutil.which('oxipng')
+
+
+def _recompress_png(image_bytes: bytes) -> bytes:
+    """
+    Recompress PNG bytes through oxipng via stdin/stdout.
+
+    oxipng (Rust, multi-threaded) is both faster and tighter than
+    stdlib zlib at level 9. Returns the input unchanged on any failure,
+    so callers can treat this as best-effort.
+    """
+    try:
+        result = subprocess.run(
+            [_oxipng_path(), '-o', '4', '--quiet', '-'],
+            input=image_bytes,
+            stdout=subprocess.PIPE,
+            timeout=60
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return image_bytes
+
+    if result.returncode == 0 and result.stdout:
+        return result.stdout
+    return image_bytes
+
+
+def check_image_properties(img: 'Image.Image', filepath: Path, file_size: int = None) -> Dict:
+    """Analyze image and return property report.
+
+    Pass file_size when the caller has already stat'ed the file to
+    avoid a redundant stat() syscall.
+    """
+    if file_size is None:
+        file_size = filepath.stat().st_size if filepath.exists() else 0
+
     properties = {
         'dimensions': img.size,
         'mode': img.mode,
         'format': img.format,
         'has_transparency': img.mode in ('RGBA', 'LA', 'P') or 'transparency' in img.info,
-        'file_size': filepath.stat().st_size if filepath.exists() else 0,
+        'file_size': file_size,
     }
 
     # Check if image has actual transparency data
     if img.mode == 'RGBA':
-        alpha = img.split()[3]
-        extrema = alpha.getextrema()
+        # Per-channel extrema without split()'s four full-band copies
+        extrema = img.getextrema()[3]
         properties['has_alpha_channel'] = True
         properties['alpha_range'] = extrema
         properties['fully_opaque'] = extrema == (255, 255)
@@ -80,16 +129,23 @@ def optimize_logo(
         output_dir.mkdir(parents=True, exist_ok=True)
 
     # Load image
+    Image = _load_pil()
     print(f"📖 Loading image: {input_path}")
     img = Image.open(input_path)
 
-    # Analyze original
-    original_props = check_image_properties(img, input_path)
-    print(f"\n📊 Original Image:")
-    print(f"   Dimensions: {original_props['dimensions'][0]}x{original_props['dimensions'][1]}")
-    print(f"   Mode: {original_props['mode']}")
-    print(f"   File size: {original_props['file_size']/1024:.1f} KB")
-    print(f"   Has transparency: {original_props['has_transparency']}")
+    # Analyze original (stat once, share the size with the report)
+    file_size = input_path.stat().st_size
+    original_props = check_image_properties(img, input_path, file_size)
+
+    # Accumulate report lines and emit them in one write - per-line
+    # print() flushes add up when output is redirected in batch runs
+    report = [
+        "\n📊 Original Image:",
+        f"   Dimensions: {original_props['dimensions'][0]}x{original_props['dimensions'][1]}",
+        f"   Mode: {original_props['mode']}",
+        f"   File size: {original_props['file_size']/1024:.1f} KB",
+        f"   Has transparency: {original_props['has_transparency']}",
+    ]
 
     # Recommendations
     recommendations = []
@@ -112,12 +168,13 @@ def optimize_logo(
         recommendations.append(f"Image mode is {img.mode}. Converting to RGBA recommended")
 
     if recommendations:
-        print(f"\n💡 Recommendations:")
-        for rec in recommendations:
-            print(f"   - {rec}")
+        report.append("\n💡 Recommendations:")
+        report.extend(f"   - {rec}" for rec in recommendations)
+    print('\n'.join(report))
 
-    # Process image
-    processed_img = img.copy()
+    # Process image - no upfront copy needed: convert()/resize() below
+    # each return a new Image, the original is never mutated
+    processed_img = img
 
     # Ensure RGBA mode for logos
     if processed_img.mode != 'RGBA':
@@ -136,6 +193,13 @@ def optimize_logo(
         ratio = max_size / max(processed_img.size)
         new_size = tuple(int(dim * ratio) for dim in processed_img.size)
         print(f"\n🔍 Resizing: {processed_img.size} → {new_size}")
+        # For big downscales, do most of the shrink with an integer
+        # box-average first (very fast), leaving LANCZOS only the final
+        # <2x step - visually equivalent, several times faster on large inputs
+        factor = min(processed_img.size[0] // new_size[0],
+                     processed_img.size[1] // new_size[1])
+        if factor >= 2:
+            processed_img = processed_img.reduce(factor)
         processed_img = processed_img.resize(new_size, Image.Resampling.LANCZOS)
 
     result = {
@@ -144,11 +208,17 @@ def optimize_logo(
         'original_size': original_props['file_size'],
     }
 
-    # Save optimized PNG
-    if not base64_only:
-        output_path = output_dir / f"{input_path.stem}_optimized.png"
-        print(f"\n💾 Saving optimized PNG: {output_path}")
+    # Encode PNG once - the same bytes serve the on-disk file and the
+    # base64 artifact (zlib at level 9 is the dominant cost here, so
+    # running the encoder a second time would roughly double the runtime)
+    from io import BytesIO
 
+    buffer = BytesIO()
+    if optimize and _oxipng_path():
+        # Cheap zlib pass - oxipng below does the real compression work
+        processed_img.save(buffer, format='PNG', compress_level=1)
+        image_bytes = _recompress_png(buffer.getvalue())
+    else:
         save_kwargs = {
             'format': 'PNG',
         }
@@ -156,9 +226,17 @@ def optimize_logo(
             save_kwargs['optimize'] = True
             save_kwargs['compress_level'] = 9
 
-        processed_img.save(output_path, **save_kwargs)
+        processed_img.save(buffer, **save_kwargs)
+        image_bytes = buffer.getvalue()
 
-        optimized_size = output_path.stat().st_size
+    # Save optimized PNG
+    if not base64_only:
+        output_path = output_dir / f"{input_path.stem}_optimized.png"
+        print(f"\n💾 Saving optimized PNG: {output_path}")
+
+        output_path.write_bytes(image_bytes)
+
+        optimized_size = len(image_bytes)
         compression_ratio = (1 - optimized_size / original_props['file_size']) * 100
 
         print(f"   Original: {original_props['file_size']/1024:.1f} KB")
@@ -181,19 +259,15 @@ def optimize_logo(
     base64_path = output_dir / f"{input_path.stem}_base64.txt"
     print(f"\n🔐 Generating base64: {base64_path}")
 
-    # Save processed image to bytes
-    from io import BytesIO
-    buffer = BytesIO()
-    processed_img.save(buffer, format='PNG', optimize=optimize)
-    image_bytes = buffer.getvalue()
+    # Reuse the PNG bytes encoded above - no second encode. Writing the
+    # prefix and encoded bytes separately skips the str decode and the
+    # f-string concat, which for a big PNG are two extra ~300KB copies
+    b64 = binascii.b2a_base64(image_bytes, newline=False)
+    with open(base64_path, 'wb') as f:
+        f.write(b'data:image/png;base64,')
+        f.write(b64)
 
-    b64_string = base64.b64encode(image_bytes).decode('utf-8')
-    data_url = f'data:image/png;base64,{b64_string}'
-
-    with open(base64_path, 'w') as f:
-        f.write(data_url)
-
-    base64_size = len(data_url.encode('utf-8'))
+    base64_size = len(b64) + 22  # encoded payload + data-url prefix
     print(f"   Base64 size: {base64_size/1024:.1f} KB")
 
     result['base64_file'] = base64_path
@@ -204,32 +278,34 @@ def optimize_logo(
         print(f"\n⚠️  Warning: Base64 encoding is {base64_size/1024:.1f}KB")
         print(f"   This may cause Cairo rendering issues when embedded in Lottie JSON")
 
-    # Summary
-    print(f"\n✅ Logo prepared successfully!")
-    print(f"\n📝 Usage in Lottie JSON:")
-    print(f"\n   For development/rendering (recommended):")
-    print(f"   {{")
-    print(f"     \"assets\": [{{")
-    print(f"       \"id\": \"logo_image\",")
-    print(f"       \"w\": {processed_img.size[0]},")
-    print(f"       \"h\": {processed_img.size[1]},")
-    if not base64_only:
-        print(f"       \"p\": \"{output_path.name}\",")
-    else:
-        print(f"       \"p\": \"{input_path.name}\",")
-    print(f"       \"e\": 0  // External file")
-    print(f"     }}]")
-    print(f"   }}")
-    print(f"\n   For distribution (embedded):")
-    print(f"   {{")
-    print(f"     \"assets\": [{{")
-    print(f"       \"id\": \"logo_image\",")
-    print(f"       \"w\": {processed_img.size[0]},")
-    print(f"       \"h\": {processed_img.size[1]},")
-    print(f"       \"p\": \"<paste contents of {base64_path.name}>\",")
-    print(f"       \"e\": 1  // Embedded base64")
-    print(f"     }}]")
-    print(f"   }}")
+    # Summary (one preformatted template, one write)
+    external_name = input_path.name if base64_only else output_path.name
+    print(f"""
+✅ Logo prepared successfully!
+
+📝 Usage in Lottie JSON:
+
+   For development/rendering (recommended):
+   {{
+     "assets": [{{
+       "id": "logo_image",
+       "w": {processed_img.size[0]},
+       "h": {processed_img.size[1]},
+       "p": "{external_name}",
+       "e": 0  // External file
+     }}]
+   }}
+
+   For distribution (embedded):
+   {{
+     "assets": [{{
+       "id": "logo_image",
+       "w": {processed_img.size[0]},
+       "h": {processed_img.size[1]},
+       "p": "<paste contents of {base64_path.name}>",
+       "e": 1  // Embedded base64
+     }}]
+   }}""")
 
     return result
 
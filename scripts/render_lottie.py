@@ -8,30 +8,149 @@ Renders Lottie animations to:
 - PNG sequence (for advanced editing)
 """
 
+import functools
 import sys
 import json
+import mmap
 import os
+import shutil
+import subprocess
 from pathlib import Path
 from typing import Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional - C-backed JSON, falls back to stdlib
 
-def validate_assets(lottie_path: Path) -> Tuple[bool, str]:
+
+@functools.lru_cache(maxsize=1)
+def _lottie_modules():
+    """
+    Import the lottie entry points once per process.
+
+    Loops that render many files (batch export) would otherwise pay the
+    import-machinery lookup on every call; caching the resolved
+    callables makes repeat renders hit a plain tuple unpack. Failed
+    imports are not cached, so the install-hint paths still fire.
+    """
+    from lottie.parsers.tgs import parse_tgs
+    from lottie.exporters.gif import export_gif
+    from lottie.exporters.core import export_mp4
+    from lottie.objects import Animation
+    return parse_tgs, export_gif, export_mp4, Animation
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_hw_encoder() -> str:
+    """
+    Probe ffmpeg once per process for a usable H.264 hardware encoder.
+
+    Hardware encoders (NVENC, VideoToolbox, VAAPI) run several times
+    faster than libx264 and free the CPU for Cairo rasterization.
+    Returns the encoder name, or None to use ffmpeg's default (libx264).
+    """
+    if not shutil.which('ffmpeg'):
+        return None
+
+    try:
+        result = subprocess.run(
+            ['ffmpeg', '-hide_banner', '-encoders'],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+
+    if result.returncode != 0:
+        return None
+
+    for name in ('h264_nvenc', 'h264_videotoolbox', 'h264_vaapi'):
+        if name in result.stdout:
+            return name
+    return None
+
+
+def _mp4_output_params(encoder: str, encoder_profile: str = 'quality') -> list:
+    """
+    Build ffmpeg output params for export_mp4, keyed on the probed
+    hardware encoder (None = libx264 software default).
+
+    encoder_profile 'fast' trades quality for encode speed (ultrafast/
+    zerolatency on x264, the p1/low-latency preset on NVENC) and is
+    meant for throwaway test renders; 'quality' is the default.
+
+    All variants keep the QuickTime-compatibility flags: +faststart for
+    progressive playback, yuv420p pixel format, and even dimensions.
+    """
+    fast = encoder_profile == 'fast'
+    common = [
+        '-movflags', '+faststart',
+        '-pix_fmt', 'yuv420p',
+        '-vf', 'scale=trunc(iw/2)*2:trunc(ih/2)*2'
+    ]
+
+    if encoder == 'h264_nvenc':
+        preset = ['-preset', 'p1', '-tune', 'll'] if fast else \
+                 ['-preset', 'p4', '-tune', 'hq']
+        return ['-c:v', 'h264_nvenc'] + preset + ['-rc', 'vbr', '-cq', '23'] + common
+    if encoder == 'h264_videotoolbox':
+        return ['-c:v', 'h264_videotoolbox', '-b:v', '6M'] + common
+    if encoder == 'h264_vaapi':
+        # VAAPI frames must be uploaded to the GPU; format/hwupload
+        # replaces the yuv420p/scale combo used by the other encoders
+        return ['-vaapi_device', '/dev/dri/renderD128',
+                '-c:v', 'h264_vaapi',
+                '-movflags', '+faststart',
+                '-vf', 'format=nv12,hwupload,scale_vaapi=trunc(iw/2)*2:trunc(ih/2)*2']
+    if fast:
+        return ['-preset', 'ultrafast', '-tune', 'zerolatency'] + common
+    return common
+
+
+def _load_lottie(path: str | Path) -> dict:
+    """Parse a Lottie JSON file once; callers share the resulting dict.
+
+    Uses orjson when available - Lottie files are float-heavy keyframe
+    arrays where the C parser is several times faster than stdlib json.
+    """
+    raw = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def validate_assets(lottie_path: Path, data: dict = None) -> Tuple[bool, str]:
     """
     Validate that all external assets referenced in Lottie JSON exist.
 
     Args:
         lottie_path: Path to Lottie JSON file
+        data: Pre-parsed Lottie dict (skips re-reading the file)
 
     Returns:
         Tuple of (success, error_message)
     """
-    try:
-        with open(lottie_path, 'r') as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
-        return False, f"Invalid JSON: {e}"
-    except Exception as e:
-        return False, f"Failed to read file: {e}"
+    if data is None:
+        # Self-contained files (everything embedded as base64, the
+        # common case after prepare_logo) have no '"e":0' marker at all,
+        # so a byte-level prescan can skip the JSON parse entirely
+        try:
+            with open(lottie_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if mm.find(b'"e":0') == -1 and mm.find(b'"e": 0') == -1:
+                        return True, ""  # No external assets referenced
+        except (OSError, ValueError):
+            pass  # empty or unmappable file - fall through to the parse
+
+        try:
+            data = _load_lottie(lottie_path)
+        except ValueError as e:
+            # Covers json.JSONDecodeError and orjson.JSONDecodeError
+            return False, f"Invalid JSON: {e}"
+        except Exception as e:
+            return False, f"Failed to read file: {e}"
 
     assets = data.get('assets', [])
     if not assets:
@@ -39,6 +158,7 @@ def validate_assets(lottie_path: Path) -> Tuple[bool, str]:
 
     lottie_dir = lottie_path.parent
     missing_assets = []
+    dir_names = None  # filled by one scandir on first use
 
     for asset in assets:
         # Check if it's an external asset (e: 0)
@@ -52,7 +172,20 @@ def validate_assets(lottie_path: Path) -> Tuple[bool, str]:
             # Resolve path relative to Lottie JSON location
             full_path = lottie_dir / asset_path
 
-            if not full_path.exists():
+            if '/' in asset_path or '\\' in asset_path:
+                present = full_path.exists()
+            else:
+                # Plain filenames (the usual case): one scandir builds a
+                # name set, then membership tests replace per-asset
+                # exists() syscalls
+                if dir_names is None:
+                    try:
+                        dir_names = {entry.name for entry in os.scandir(lottie_dir)}
+                    except OSError:
+                        dir_names = set()
+                present = asset_path in dir_names
+
+            if not present:
                 missing_assets.append(f"  - {asset_path} (expected at: {full_path})")
 
     if missing_assets:
@@ -72,11 +205,12 @@ def verify_output(output_path: Path) -> Tuple[bool, str]:
     Returns:
         Tuple of (success, warning_message)
     """
-    if not output_path.exists():
+    # One stat covers both the existence and size checks
+    try:
+        file_size = os.stat(output_path).st_size
+    except FileNotFoundError:
         return False, "Output file was not created"
 
-    file_size = output_path.stat().st_size
-
     # Check for suspiciously small files (likely blank or corrupted)
     if file_size < 1024:  # Less than 1KB
         return False, f"Output file is suspiciously small ({file_size} bytes) - likely blank or corrupted"
@@ -87,12 +221,156 @@ def verify_output(output_path: Path) -> Tuple[bool, str]:
     return True, ""
 
 
+def _absolutize_assets(data: dict, lottie_dir: Path) -> None:
+    """
+    Rewrite external asset paths to absolute paths, in place.
+
+    The renderers used to os.chdir() into the Lottie directory so the
+    library could resolve relative asset paths; mutating process-global
+    state is hostile to threads and any future parallel rendering, so
+    resolve the paths up front instead.
+    """
+    for asset in data.get('assets') or []:
+        path = asset.get('p', '')
+        if asset.get('e') == 0 and path and not path.startswith('data:'):
+            directory = asset.get('u', '')
+            full = lottie_dir / directory / path if directory else lottie_dir / path
+            if full.exists():
+                asset['p'] = str(full.resolve())
+                asset['u'] = ''
+
+
+def _cull_invisible(data: dict) -> int:
+    """
+    Drop layers that cannot contribute to the render, in place.
+
+    A layer is invisible when it is flagged hidden (hd), its opacity is
+    statically zero, every opacity keyframe starts at zero, or its
+    lifetime lies entirely outside the animation's [ip, op] range.
+    Cairo still composites such layers frame by frame, so pruning them
+    up front saves real rasterization time on busy exports. Layers that
+    other layers reference - transform parents and track-matte sources -
+    are always kept, since they affect the render without being drawn
+    themselves. Returns the number of layers removed.
+    """
+    layers = data.get('layers')
+    if not layers:
+        return 0
+
+    anim_ip = data.get('ip', 0)
+    anim_op = data.get('op')
+    parent_inds = {
+        layer.get('parent') for layer in layers
+        if layer.get('parent') is not None
+    }
+
+    def _visible(layer: dict) -> bool:
+        if layer.get('td') or layer.get('ind') in parent_inds:
+            return True  # matte source or transform parent - keep
+
+        if layer.get('hd') is True:
+            return False
+
+        # Lifetime entirely before the animation starts or after it ends
+        if anim_op is not None:
+            layer_ip = layer.get('ip')
+            layer_op = layer.get('op')
+            if layer_op is not None and layer_op <= anim_ip:
+                return False
+            if layer_ip is not None and layer_ip >= anim_op:
+                return False
+
+        opacity = layer.get('ks', {}).get('o')
+        if not isinstance(opacity, dict):
+            return True
+        k = opacity.get('k')
+        if opacity.get('a', 0) == 0:
+            return k not in (0, [0])
+        if isinstance(k, list) and k and all(
+            isinstance(kf, dict) and kf.get('s') == [0] for kf in k
+        ):
+            return False
+        return True
+
+    kept = [layer for layer in layers if _visible(layer)]
+    removed = len(layers) - len(kept)
+    if removed:
+        layers[:] = kept
+    return removed
+
+
+def _render_gif_ffmpeg(animation, output_path: Path, fps: int,
+                       encoder_profile: str = 'quality') -> bool:
+    """
+    Rasterize frames with Cairo and stream them straight into an ffmpeg
+    palette pipeline.
+
+    Fusing rasterization and encoding keeps peak memory at one frame
+    instead of the full sequence export_gif accumulates (the usual
+    MemoryError culprit with embedded images), and ffmpeg's palettegen
+    produces tighter GIFs than PIL's quantizer. Returns False when
+    ffmpeg or the Cairo exporter is unavailable so the caller can fall
+    back to export_gif.
+    """
+    if not shutil.which('ffmpeg'):
+        return False
+
+    try:
+        from lottie.exporters.cairo import export_png
+    except ImportError:
+        return False
+
+    if encoder_profile == 'fast':
+        # Test renders: smaller palette, no dithering - much cheaper
+        palette_filter = 'split[s0][s1];[s0]palettegen=max_colors=64[p];[s1][p]paletteuse=dither=none'
+    else:
+        palette_filter = 'split[s0][s1];[s0]palettegen[p];[s1][p]paletteuse'
+
+    # Playback speed is governed by the source frame rate: a lower
+    # requested fps subsamples the source frames rather than retiming
+    # them (piping every frame with the requested -framerate used to
+    # play the GIF in slow motion whenever fps < animation.frame_rate)
+    source_fps = float(animation.frame_rate or fps)
+    if fps and fps < source_fps:
+        step = source_fps / fps
+        out_fps = fps
+    else:
+        step = 1.0
+        out_fps = source_fps
+
+    proc = subprocess.Popen(
+        ['ffmpeg', '-y', '-loglevel', 'error',
+         '-f', 'image2pipe', '-framerate', str(out_fps), '-i', '-',
+         '-vf', palette_filter,
+         '-loop', '0', str(output_path)],
+        stdin=subprocess.PIPE
+    )
+
+    try:
+        pos = float(int(animation.in_point))
+        out_point = int(animation.out_point)
+        while pos < out_point:
+            export_png(animation, proc.stdin, frame=int(pos))
+            pos += step
+        proc.stdin.close()
+    except BrokenPipeError:
+        proc.stdin.close()
+    except Exception:
+        proc.kill()
+        proc.wait()
+        raise
+
+    return proc.wait() == 0
+
+
 def render_lottie_to_gif(
     lottie_path: str | Path,
     output_path: str | Path,
     width: int = None,
     height: int = None,
-    fps: int = None
+    fps: int = None,
+    data: dict = None,
+    encoder_profile: str = 'quality'
 ) -> bool:
     """
     Render Lottie JSON to GIF.
@@ -103,14 +381,16 @@ def render_lottie_to_gif(
         width: Output width (default: use Lottie dimensions)
         height: Output height (default: use Lottie dimensions)
         fps: Frame rate (default: use Lottie frame rate)
+        data: Pre-parsed Lottie dict (skips re-reading the file for
+              validation and builds the Animation without a second parse)
+        encoder_profile: 'quality' (default) or 'fast' for cheap test renders
 
     Returns:
         True if successful, False otherwise
     """
     # CRITICAL FIX: Import from correct module path
     try:
-        from lottie.parsers.tgs import parse_tgs
-        from lottie.exporters.gif import export_gif
+        parse_tgs, export_gif, _, Animation = _lottie_modules()
     except ImportError as e:
         print("❌ Error: lottie-python not installed or missing dependencies")
         print("   Install with: pip install lottie[all]")
@@ -126,22 +406,31 @@ def render_lottie_to_gif(
 
     # Validate assets before attempting render
     print(f"🔍 Validating external assets...")
-    assets_ok, assets_error = validate_assets(lottie_path)
+    assets_ok, assets_error = validate_assets(lottie_path, data)
     if not assets_ok:
         print(f"❌ Asset validation failed:")
         print(assets_error)
         print(f"\n💡 Tip: Asset paths are resolved relative to the Lottie JSON file location")
         return False
 
-    # Change to Lottie file directory for asset resolution
-    original_cwd = os.getcwd()
     lottie_dir = lottie_path.parent.absolute()
-    os.chdir(lottie_dir)
 
     try:
-        # CRITICAL FIX: Parse directly from file, don't load as dict first
         print(f"📖 Loading Lottie: {lottie_path.name}")
-        animation = parse_tgs(str(lottie_path))
+        if data is None and lottie_path.suffix == '.tgs':
+            # Gzipped sticker - self-contained, let the library parse it
+            animation = parse_tgs(str(lottie_path))
+        else:
+            if data is None:
+                data = _load_lottie(lottie_path)
+            # Resolve external asset paths against the Lottie file's
+            # directory in the dict itself, instead of chdir'ing the
+            # whole process there for the duration of the render
+            _absolutize_assets(data, lottie_dir)
+            culled = _cull_invisible(data)
+            if culled:
+                print(f"   Skipping {culled} invisible layer(s)")
+            animation = Animation.load(data)
 
         # CRITICAL FIX: Get dimensions from Animation object, not JSON dict
         if width is None:
@@ -153,8 +442,11 @@ def render_lottie_to_gif(
 
         print(f"🎬 Rendering GIF with Cairo: {width}x{height} @ {fps} fps")
 
-        # Export to GIF - library handles size internally
-        export_gif(animation, str(output_path))
+        # Stream frames into ffmpeg's palette pipeline when possible
+        # (bounded memory, better palette); export_gif remains the
+        # fallback when ffmpeg isn't installed
+        if not _render_gif_ffmpeg(animation, output_path, fps, encoder_profile):
+            export_gif(animation, str(output_path))
 
         # Verify output
         output_ok, output_error = verify_output(output_path)
@@ -216,17 +508,15 @@ def render_lottie_to_gif(
             traceback.print_exc()
             return False
 
-    finally:
-        # Restore original working directory
-        os.chdir(original_cwd)
-
 
 def render_lottie_to_mp4(
     lottie_path: str | Path,
     output_path: str | Path,
     width: int = None,
     height: int = None,
-    fps: int = None
+    fps: int = None,
+    data: dict = None,
+    encoder_profile: str = 'quality'
 ) -> bool:
     """
     Render Lottie JSON to MP4 video.
@@ -237,15 +527,17 @@ def render_lottie_to_mp4(
         width: Output width (default: use Lottie dimensions)
         height: Output height (default: use Lottie dimensions)
         fps: Frame rate (default: use Lottie frame rate)
+        data: Pre-parsed Lottie dict (skips re-reading the file for
+              validation and builds the Animation without a second parse)
+        encoder_profile: 'quality' (default) or 'fast' for cheap test renders
 
     Returns:
         True if successful, False otherwise
     """
     # CRITICAL FIX: Import from correct module paths
+    # (MP4 export may require additional dependencies)
     try:
-        from lottie.parsers.tgs import parse_tgs
-        # Note: MP4 export may require additional dependencies
-        from lottie.exporters.core import export_mp4
+        parse_tgs, _, export_mp4, Animation = _lottie_modules()
     except ImportError as e:
         print("❌ Error: lottie-python or dependencies not installed")
         print("   Install with: pip install lottie[all]")
@@ -262,22 +554,31 @@ def render_lottie_to_mp4(
 
     # Validate assets before attempting render
     print(f"🔍 Validating external assets...")
-    assets_ok, assets_error = validate_assets(lottie_path)
+    assets_ok, assets_error = validate_assets(lottie_path, data)
     if not assets_ok:
         print(f"❌ Asset validation failed:")
         print(assets_error)
         print(f"\n💡 Tip: Asset paths are resolved relative to the Lottie JSON file location")
         return False
 
-    # Change to Lottie file directory for asset resolution
-    original_cwd = os.getcwd()
     lottie_dir = lottie_path.parent.absolute()
-    os.chdir(lottie_dir)
 
     try:
-        # CRITICAL FIX: Parse directly from file, don't load as dict first
         print(f"📖 Loading Lottie: {lottie_path.name}")
-        animation = parse_tgs(str(lottie_path))
+        if data is None and lottie_path.suffix == '.tgs':
+            # Gzipped sticker - self-contained, let the library parse it
+            animation = parse_tgs(str(lottie_path))
+        else:
+            if data is None:
+                data = _load_lottie(lottie_path)
+            # Resolve external asset paths against the Lottie file's
+            # directory in the dict itself, instead of chdir'ing the
+            # whole process there for the duration of the render
+            _absolutize_assets(data, lottie_dir)
+            culled = _cull_invisible(data)
+            if culled:
+                print(f"   Skipping {culled} invisible layer(s)")
+            animation = Animation.load(data)
 
         # CRITICAL FIX: Get dimensions from Animation object, not JSON dict
         if width is None:
@@ -287,28 +588,36 @@ def render_lottie_to_mp4(
         if fps is None:
             fps = int(animation.frame_rate) if animation.frame_rate else 30
 
+        encoder = _detect_hw_encoder()
+
         print(f"🎬 Rendering MP4: {width}x{height} @ {fps} fps")
-        print(f"   Using QuickTime-compatible encoding")
+        print(f"   Using QuickTime-compatible encoding"
+              + (f" ({encoder})" if encoder else ""))
 
-        # Export to MP4 with QuickTime-compatible encoding
-        # These parameters ensure compatibility with QuickTime Player on macOS:
-        # - movflags +faststart: Enable progressive playback
-        # - pix_fmt yuv420p: Compatible pixel format
-        # - scale filter: Ensure even dimensions (required by some codecs)
+        # Export to MP4 with QuickTime-compatible encoding, using a
+        # hardware encoder when ffmpeg advertises one (several times
+        # faster than libx264 and frees the CPU for rasterization)
         try:
             export_mp4(
                 animation,
                 str(output_path),
-                output_params=[
-                    '-movflags', '+faststart',
-                    '-pix_fmt', 'yuv420p',
-                    '-vf', 'scale=trunc(iw/2)*2:trunc(ih/2)*2'
-                ]
+                output_params=_mp4_output_params(encoder, encoder_profile)
             )
         except TypeError:
             # Fallback if export_mp4 doesn't support output_params
             print("   Warning: Using default encoding (may not work in QuickTime)")
             export_mp4(animation, str(output_path))
+        except Exception:
+            if encoder is None:
+                raise
+            # Encoder advertised but unusable (e.g. no GPU device in
+            # this environment) - retry once with the software path
+            print(f"   Warning: {encoder} failed, falling back to libx264")
+            export_mp4(
+                animation,
+                str(output_path),
+                output_params=_mp4_output_params(None, encoder_profile)
+            )
 
         # Verify output
         output_ok, output_error = verify_output(output_path)
@@ -331,13 +640,15 @@ def render_lottie_to_mp4(
         traceback.print_exc()
         return False
 
-    finally:
-        # Restore original working directory
-        os.chdir(original_cwd)
+
+def _render_job(renderer, args, kwargs):
+    """Worker-process entry point: map a renderer's bool to an exit code."""
+    sys.exit(0 if renderer(*args, **kwargs) else 1)
 
 
 def main():
     import argparse
+    import multiprocessing
 
     parser = argparse.ArgumentParser(
         description='Render Lottie JSON to GIF or MP4',
@@ -367,7 +678,7 @@ Examples:
     parser.add_argument('--test-render', action='store_true',
                         help='Test render first (200x200, 15fps, 60 frames) to catch issues early')
     parser.add_argument('--preview-frames', type=int, metavar='N',
-                        help='Render only first N frames for quick preview (modifies JSON temporarily)')
+                        help='Render only first N frames for quick preview (truncated in memory)')
 
     args = parser.parse_args()
 
@@ -377,35 +688,37 @@ Examples:
     height = args.height
     fps = args.fps
 
-    # Preview frames mode - create temporary JSON with limited frames
-    temp_preview_file = None
+    # Parse the Lottie JSON once; preview, test and full renders all
+    # share the dict instead of each re-reading the file
+    try:
+        lottie_data = _load_lottie(lottie_path)
+    except Exception as e:
+        print(f"❌ Error reading Lottie JSON: {e}")
+        sys.exit(1)
+
+    # Preview frames mode - truncate the animation in memory; the dict
+    # is what the renderers consume, so no temp file is needed
     if args.preview_frames:
         print(f"🔍 Preview mode: Rendering only first {args.preview_frames} frames\n")
 
-        try:
-            with open(lottie_path, 'r') as f:
-                lottie_data = json.load(f)
-
-            original_op = lottie_data.get('op', 180)
-            preview_op = min(args.preview_frames, original_op)
-
-            lottie_data['op'] = preview_op
-
-            # Create temporary preview file
-            temp_preview_file = Path(lottie_path).parent / f"_preview_{Path(lottie_path).name}"
-            with open(temp_preview_file, 'w') as f:
-                json.dump(lottie_data, f)
+        original_op = lottie_data.get('op', 180)
+        preview_op = min(args.preview_frames, original_op)
 
-            print(f"   Original duration: {original_op} frames")
-            print(f"   Preview duration: {preview_op} frames")
-            print(f"   Temporary preview file: {temp_preview_file}\n")
+        lottie_data['op'] = preview_op
 
-            # Use the preview file for rendering
-            lottie_path = str(temp_preview_file)
+        print(f"   Original duration: {original_op} frames")
+        print(f"   Preview duration: {preview_op} frames\n")
 
-        except Exception as e:
-            print(f"❌ Error creating preview: {e}")
-            sys.exit(1)
+    # Pick the renderer once; test and full renders share it
+    output_ext = Path(output_path).suffix.lower()
+    if output_ext == '.gif':
+        renderer = render_lottie_to_gif
+    elif output_ext == '.mp4':
+        renderer = render_lottie_to_mp4
+    else:
+        print(f"❌ Error: Unsupported output format: {output_ext}")
+        print("   Supported: .gif, .mp4")
+        sys.exit(1)
 
     # Test render mode
     if args.test_render:
@@ -414,18 +727,25 @@ Examples:
         # Create test output path
         test_output = Path(output_path).with_stem(Path(output_path).stem + "_test")
 
-        output_ext = Path(output_path).suffix.lower()
-
-        if output_ext == '.gif':
-            success = render_lottie_to_gif(lottie_path, test_output, 200, 200, 15)
-        elif output_ext == '.mp4':
-            success = render_lottie_to_mp4(lottie_path, test_output, 200, 200, 15)
-        else:
-            print(f"❌ Error: Unsupported output format: {output_ext}")
-            print("   Supported: .gif, .mp4")
-            sys.exit(1)
+        # Start the full render speculatively in a worker process while
+        # the test render runs here - on multi-core machines it is
+        # largely done by the time the prompt is answered. Declining
+        # terminates the worker and removes the partial output.
+        full_proc = multiprocessing.Process(
+            target=_render_job,
+            args=(renderer,
+                  (lottie_path, output_path, width, height, fps),
+                  {'data': lottie_data})
+        )
+        full_proc.start()
+
+        success = renderer(lottie_path, test_output, 200, 200, 15,
+                           data=lottie_data, encoder_profile='fast')
 
         if not success:
+            full_proc.terminate()
+            full_proc.join()
+            Path(output_path).unlink(missing_ok=True)
             print("\n❌ Test render failed - review errors above")
             sys.exit(1)
 
@@ -448,30 +768,21 @@ Examples:
 
         response = input("Continue with full render? [y/N]: ")
         if response.lower() != 'y':
+            full_proc.terminate()
+            full_proc.join()
+            Path(output_path).unlink(missing_ok=True)
             print("Cancelled. Review test render and adjust parameters if needed.")
             sys.exit(0)
 
-        print("\n🎬 Proceeding with full render...\n")
+        print("\n🎬 Finishing full render...\n")
+        full_proc.join()
+        if full_proc.exitcode != 0:
+            sys.exit(1)
+        return
 
     # Full render
-    output_ext = Path(output_path).suffix.lower()
-
-    if output_ext == '.gif':
-        success = render_lottie_to_gif(lottie_path, output_path, width, height, fps)
-    elif output_ext == '.mp4':
-        success = render_lottie_to_mp4(lottie_path, output_path, width, height, fps)
-    else:
-        print(f"❌ Error: Unsupported output format: {output_ext}")
-        print("   Supported: .gif, .mp4")
-        sys.exit(1)
-
-    # Cleanup temporary preview file if created
-    if temp_preview_file and temp_preview_file.exists():
-        try:
-            temp_preview_file.unlink()
-            print(f"\n🧹 Cleaned up temporary preview file")
-        except Exception as e:
-            print(f"\n⚠️  Warning: Could not delete temporary file {temp_preview_file}: {e}")
+    success = renderer(lottie_path, output_path, width, height, fps,
+                       data=lottie_data)
 
     if not success:
         sys.exit(1)
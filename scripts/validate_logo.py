@@ -9,9 +9,76 @@ Validates PNG/SVG/JPG files for:
 - Image readability
 """
 
+import struct
+import sys
 from pathlib import Path
 from PIL import Image
-import sys
+
+# PNG color type byte -> PIL-style mode name
+_PNG_MODES = {0: 'L', 2: 'RGB', 3: 'P', 4: 'LA', 6: 'RGBA'}
+
+
+def _probe_image_header(logo_path: Path):
+    """
+    Read format, dimensions, mode and alpha presence straight from the
+    file header, without decoding pixel data.
+
+    PNG needs only its IHDR chunk (plus a tRNS scan for palette
+    transparency) and JPEG only its first SOF marker, so one small read
+    replaces PIL's full decode - microseconds instead of tens of ms on
+    big logos. Returns (format, (w, h), mode, has_alpha), or None when
+    the header doesn't parse cleanly so the caller can fall back to PIL.
+    """
+    try:
+        with open(logo_path, 'rb') as f:
+            head = f.read(65536)
+    except OSError:
+        return None
+
+    # PNG: signature, then IHDR is always the first chunk
+    if head.startswith(b'\x89PNG\r\n\x1a\n'):
+        if len(head) < 26 or head[12:16] != b'IHDR':
+            return None
+        width, height = struct.unpack('>II', head[16:24])
+        color_type = head[25]
+        mode = _PNG_MODES.get(color_type)
+        if mode is None:
+            return None
+        has_alpha = color_type in (4, 6)
+        if color_type == 3:
+            # Palette images are transparent iff a tRNS chunk precedes IDAT
+            pos = 8
+            while pos + 8 <= len(head):
+                (length,) = struct.unpack('>I', head[pos:pos + 4])
+                chunk_type = head[pos + 4:pos + 8]
+                if chunk_type == b'tRNS':
+                    has_alpha = True
+                    break
+                if chunk_type == b'IDAT':
+                    break
+                pos += length + 12  # length + type + data + CRC
+        return 'PNG', (width, height), mode, has_alpha
+
+    # JPEG: walk the marker chain to the first SOF for dimensions
+    if head.startswith(b'\xff\xd8'):
+        pos = 2
+        while pos + 10 <= len(head):
+            if head[pos] != 0xFF:
+                return None
+            marker = head[pos + 1]
+            if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+                pos += 2  # standalone marker, no length field
+                continue
+            (length,) = struct.unpack('>H', head[pos + 2:pos + 4])
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack('>HH', head[pos + 5:pos + 9])
+                components = head[pos + 9]
+                mode = {1: 'L', 3: 'RGB', 4: 'CMYK'}.get(components, 'RGB')
+                return 'JPEG', (width, height), mode, False  # JPEG has no alpha
+            pos += 2 + length
+        return None  # SOF beyond our read window - let PIL handle it
+
+    return None
 
 
 def validate_logo(logo_path: str | Path) -> tuple[bool, dict]:
@@ -26,13 +93,16 @@ def validate_logo(logo_path: str | Path) -> tuple[bool, dict]:
     """
     logo_path = Path(logo_path)
 
-    if not logo_path.exists():
+    # One stat doubles as the existence check and supplies both sizes
+    try:
+        file_size = logo_path.stat().st_size
+    except FileNotFoundError:
         return False, {'error': f'File not found: {logo_path}'}
 
     info = {
         'path': str(logo_path),
-        'file_size_bytes': logo_path.stat().st_size,
-        'file_size_mb': logo_path.stat().st_size / (1024 * 1024),
+        'file_size_bytes': file_size,
+        'file_size_mb': file_size / (1024 * 1024),
         'format': None,
         'dimensions': None,
         'has_alpha': False,
@@ -62,49 +132,55 @@ def validate_logo(logo_path: str | Path) -> tuple[bool, dict]:
         return info['passes'], info
 
     elif ext in ['.png', '.jpg', '.jpeg']:
-        # Raster image validation using PIL
-        try:
-            with Image.open(logo_path) as img:
-                info['format'] = img.format
-                info['dimensions'] = img.size
-                info['mode'] = img.mode
-                info['has_alpha'] = img.mode in ('RGBA', 'LA', 'PA') or (
-                    img.mode == 'P' and 'transparency' in img.info
-                )
-
-                width, height = img.size
-
-                # Format check
-                print(f"✓ Valid {img.format} file ({width}x{height})")
-
-                # Alpha channel check
-                if info['has_alpha']:
-                    print(f"✓ Has transparency/alpha channel ({img.mode})")
-                else:
-                    info['warnings'].append(f'No transparency detected ({img.mode}). Logo may have background.')
-                    print(f"⚠ No transparency ({img.mode}). Consider using PNG with alpha channel for better results.")
-
-                # Dimension check
-                if width < 100 or height < 100:
-                    info['warnings'].append(f'Small dimensions ({width}x{height}). May appear pixelated.')
-                    print(f"⚠ Small dimensions ({width}x{height}). Larger logos animate better.")
-                elif width > 4096 or height > 4096:
-                    info['warnings'].append(f'Very large dimensions ({width}x{height}). Consider resizing.')
-                    print(f"⚠ Large dimensions ({width}x{height}). May slow rendering.")
-                else:
-                    print(f"✓ Good dimensions ({width}x{height})")
-
-                # File size check
-                if info['file_size_mb'] > 10:
-                    info['warnings'].append(f'Large file size ({info["file_size_mb"]:.1f}MB)')
-                    print(f"⚠ Large file ({info['file_size_mb']:.1f}MB). Consider compressing.")
-                else:
-                    print(f"✓ Reasonable file size ({info['file_size_mb']:.2f}MB)")
-
-        except Exception as e:
-            info['errors'].append(f'Cannot read image file: {e}')
-            info['passes'] = False
-            return False, info
+        # Header-only probe first - everything we report lives in the
+        # first few hundred bytes, so skip the pixel decode entirely
+        props = _probe_image_header(logo_path)
+        if props is None:
+            # Unusual header layout - fall back to PIL
+            try:
+                with Image.open(logo_path) as img:
+                    props = (
+                        img.format,
+                        img.size,
+                        img.mode,
+                        img.mode in ('RGBA', 'LA', 'PA') or (
+                            img.mode == 'P' and 'transparency' in img.info
+                        ),
+                    )
+            except Exception as e:
+                info['errors'].append(f'Cannot read image file: {e}')
+                info['passes'] = False
+                return False, info
+
+        info['format'], info['dimensions'], info['mode'], info['has_alpha'] = props
+        width, height = info['dimensions']
+
+        # Format check
+        print(f"✓ Valid {info['format']} file ({width}x{height})")
+
+        # Alpha channel check
+        if info['has_alpha']:
+            print(f"✓ Has transparency/alpha channel ({info['mode']})")
+        else:
+            info['warnings'].append(f'No transparency detected ({info["mode"]}). Logo may have background.')
+            print(f"⚠ No transparency ({info['mode']}). Consider using PNG with alpha channel for better results.")
+
+        # Dimension check
+        if width < 100 or height < 100:
+            info['warnings'].append(f'Small dimensions ({width}x{height}). May appear pixelated.')
+            print(f"⚠ Small dimensions ({width}x{height}). Larger logos animate better.")
+        elif width > 4096 or height > 4096:
+            info['warnings'].append(f'Very large dimensions ({width}x{height}). Consider resizing.')
+            print(f"⚠ Large dimensions ({width}x{height}). May slow rendering.")
+        else:
+            print(f"✓ Good dimensions ({width}x{height})")
+
+        # File size check
+        if info['file_size_mb'] > 10:
+            info['warnings'].append(f'Large file size ({info["file_size_mb"]:.1f}MB)')
+            print(f"⚠ Large file ({info['file_size_mb']:.1f}MB). Consider compressing.")
+        else:
+            print(f"✓ Reasonable file size ({info['file_size_mb']:.2f}MB)")
 
     else:
         info['errors'].append(f'Unsupported file format: {ext}. Use PNG, SVG, or JPG.')
@@ -13,79 +13,77 @@ import json
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional - C-backed JSON, falls back to stdlib
 
-def validate_lottie(lottie_path: str | Path) -> tuple[bool, dict]:
-    """
-    Validate a Lottie JSON file.
+# Decorative "all good" lines are skipped when stdout is piped (CI,
+# batch runs) - only warnings and errors matter there
+_TTY = sys.stdout.isatty()
 
-    Args:
-        lottie_path: Path to Lottie JSON file
 
-    Returns:
-        Tuple of (passes: bool, info: dict with validation details)
-    """
-    lottie_path = Path(lottie_path)
+# Sentinel distinguishing absent keys from present-but-null values
+_MISSING = object()
 
-    if not lottie_path.exists():
-        return False, {'error': f'File not found: {lottie_path}'}
+# Required top-level Lottie properties
+_REQUIRED = frozenset(('v', 'fr', 'ip', 'op', 'w', 'h', 'layers'))
 
-    info = {
-        'path': str(lottie_path),
-        'file_size_kb': lottie_path.stat().st_size / 1024,
-        'passes': True,
-        'errors': [],
-        'warnings': [],
-        'details': {}
-    }
 
-    # Try to parse JSON
-    try:
-        with open(lottie_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        print("✓ Valid JSON file")
-    except json.JSONDecodeError as e:
-        info['errors'].append(f'Invalid JSON: {e}')
-        info['passes'] = False
-        return False, info
-    except Exception as e:
-        info['errors'].append(f'Cannot read file: {e}')
-        info['passes'] = False
-        return False, info
-
-    # Check required Lottie properties
-    required_props = ['v', 'fr', 'ip', 'op', 'w', 'h', 'layers']
-    missing_props = [prop for prop in required_props if prop not in data]
+def _validate_toplevel(data: dict, info: dict, emit, status) -> None:
+    """
+    Check the fixed top-level Lottie schema, mutating info in place.
 
-    if missing_props:
-        info['errors'].append(f'Missing required properties: {", ".join(missing_props)}')
+    The schema is known up front (v, fr, ip, op, w, h, layers), so one
+    get() per key feeds a straight run of threshold checks instead of
+    re-probing the dict with 'x' in data before every access. Report
+    lines go through emit (warnings) or status (TTY-only check marks)
+    so the caller can batch the output.
+    """
+    version = data.get('v', _MISSING)
+    frame_rate = data.get('fr', _MISSING)
+    in_point = data.get('ip', _MISSING)
+    out_point = data.get('op', _MISSING)
+    width = data.get('w', _MISSING)
+    height = data.get('h', _MISSING)
+    layers = data.get('layers', _MISSING)
+
+    # Set difference against the keys view is one C-level operation
+    # instead of seven membership probes
+    missing = _REQUIRED.difference(data)
+    if missing:
+        info['errors'].append(f'Missing required properties: {", ".join(sorted(missing))}')
         info['passes'] = False
     else:
-        print("✓ All required Lottie properties present")
+        status("✓ All required Lottie properties present")
 
     # Extract details
-    if 'v' in data:
-        info['details']['version'] = data['v']
-        print(f"✓ Lottie version: {data['v']}")
+    if version is not _MISSING:
+        info['details']['version'] = version
+        status(f"✓ Lottie version: {version}")
 
-    if 'fr' in data:
-        info['details']['frame_rate'] = data['fr']
-        fps = data['fr']
+    if frame_rate is not _MISSING:
+        info['details']['frame_rate'] = frame_rate
+        fps = frame_rate
         if fps < 15:
             info['warnings'].append(f'Low frame rate ({fps} fps). Consider 24-60 fps for smoother animation.')
         elif fps > 120:
             info['warnings'].append(f'Very high frame rate ({fps} fps). May cause performance issues.')
         else:
-            print(f"✓ Frame rate: {fps} fps")
+            status(f"✓ Frame rate: {fps} fps")
 
-    if 'ip' in data and 'op' in data:
-        in_point = data['ip']
-        out_point = data['op']
+    if in_point is not _MISSING and out_point is not _MISSING:
         info['details']['in_point'] = in_point
         info['details']['out_point'] = out_point
 
-        if 'fr' in data:
+        if frame_rate is not _MISSING:
             duration_frames = out_point - in_point
-            duration_seconds = duration_frames / data['fr']
+            # Integer comparisons first; divide only when the result is
+            # nonzero (also keeps a zero frame rate from raising)
+            if duration_frames > 0 and frame_rate > 0:
+                duration_seconds = duration_frames / frame_rate
+            else:
+                duration_seconds = 0.0
             info['details']['duration_seconds'] = duration_seconds
 
             if duration_seconds < 1:
@@ -93,11 +91,9 @@ def validate_lottie(lottie_path: str | Path) -> tuple[bool, dict]:
             elif duration_seconds > 10:
                 info['warnings'].append(f'Long animation ({duration_seconds:.1f}s). May increase file size.')
             else:
-                print(f"✓ Duration: {duration_seconds:.1f} seconds ({duration_frames} frames)")
+                status(f"✓ Duration: {duration_seconds:.1f} seconds ({duration_frames} frames)")
 
-    if 'w' in data and 'h' in data:
-        width = data['w']
-        height = data['h']
+    if width is not _MISSING and height is not _MISSING:
         info['details']['dimensions'] = (width, height)
 
         if width < 100 or height < 100:
@@ -105,10 +101,10 @@ def validate_lottie(lottie_path: str | Path) -> tuple[bool, dict]:
         elif width > 2048 or height > 2048:
             info['warnings'].append(f'Large dimensions ({width}x{height}). May affect performance.')
         else:
-            print(f"✓ Dimensions: {width}x{height}")
+            status(f"✓ Dimensions: {width}x{height}")
 
-    if 'layers' in data:
-        num_layers = len(data['layers'])
+    if layers is not _MISSING:
+        num_layers = len(layers)
         info['details']['num_layers'] = num_layers
 
         if num_layers == 0:
@@ -116,18 +112,90 @@ def validate_lottie(lottie_path: str | Path) -> tuple[bool, dict]:
             info['passes'] = False
         elif num_layers > 50:
             info['warnings'].append(f'Many layers ({num_layers}). May impact performance.')
-            print(f"⚠ {num_layers} layers (complex animation)")
+            emit(f"⚠ {num_layers} layers (complex animation)")
         else:
-            print(f"✓ {num_layers} layer(s)")
+            status(f"✓ {num_layers} layer(s)")
+
 
-    # Check for assets (images, fonts, etc.)
-    if 'assets' in data and len(data['assets']) > 0:
-        num_assets = len(data['assets'])
+def validate_lottie(
+    lottie_path: str | Path,
+    max_size_kb: float = None
+) -> tuple[bool, dict]:
+    """
+    Validate a Lottie JSON file.
+
+    Args:
+        lottie_path: Path to Lottie JSON file
+        max_size_kb: Optional size budget; files more than 10x over it
+                     fail from the stat alone, skipping the JSON parse
+
+    Returns:
+        Tuple of (passes: bool, info: dict with validation details)
+    """
+    lottie_path = Path(lottie_path)
+
+    # One stat doubles as the existence check and supplies the size
+    try:
+        file_size = lottie_path.stat().st_size
+    except FileNotFoundError:
+        return False, {'error': f'File not found: {lottie_path}'}
+
+    info = {
+        'path': str(lottie_path),
+        'file_size_kb': file_size / 1024,
+        'passes': True,
+        'errors': [],
+        'warnings': [],
+        'details': {}
+    }
+
+    # Buffer the report lines and write them in one call at the end -
+    # asset-heavy files emit O(assets) lines and per-line print() pays
+    # a write each time
+    out_lines = []
+    emit = out_lines.append
+    status = emit if _TTY else (lambda _msg: None)
+
+    # Obviously-oversized files fail on the stat alone - no point paying
+    # for a multi-MB parse when the verdict is already determined
+    if max_size_kb and info['file_size_kb'] > max_size_kb * 10:
+        info['errors'].append(
+            f'File size {info["file_size_kb"]:.1f}KB is more than 10x the '
+            f'{max_size_kb:.0f}KB limit - skipping content validation'
+        )
+        info['passes'] = False
+        return False, info
+
+    # Try to parse JSON (raw bytes + orjson when available - embedded
+    # base64 assets make these files large, and the C parser is several
+    # times faster than stdlib json on them)
+    try:
+        raw = lottie_path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        status("✓ Valid JSON file")
+    except ValueError as e:
+        # Covers json.JSONDecodeError and orjson.JSONDecodeError
+        info['errors'].append(f'Invalid JSON: {e}')
+        info['passes'] = False
+        return False, info
+    except Exception as e:
+        info['errors'].append(f'Cannot read file: {e}')
+        info['passes'] = False
+        return False, info
+
+    # Top-level schema checks (single fetch per key, straight-line code)
+    _validate_toplevel(data, info, emit, status)
+
+    # Check for assets (images, fonts, etc.) - bound once, () when the
+    # key is absent or empty so the block below indexes no dict twice
+    assets = data.get('assets') or ()
+    if assets:
+        num_assets = len(assets)
         info['details']['num_assets'] = num_assets
-        print(f"✓ {num_assets} asset(s)")
+        status(f"✓ {num_assets} asset(s)")
 
         # Check asset types and sizes
-        for i, asset in enumerate(data['assets']):
+        for i, asset in enumerate(assets):
             asset_id = asset.get('id', f'asset_{i}')
             is_embedded = asset.get('e', 0) == 1
 
@@ -136,15 +204,17 @@ def validate_lottie(lottie_path: str | Path) -> tuple[bool, dict]:
 
                 if is_embedded and path.startswith('data:image'):
                     # Embedded base64 image
-                    # Calculate approximate decoded size
-                    if ',' in path:
-                        base64_data = path.split(',', 1)[1]
+                    # Calculate approximate decoded size; find() + length
+                    # arithmetic measures the payload without split()'s
+                    # copy of the (potentially huge) base64 string
+                    comma_idx = path.find(',')
+                    if comma_idx >= 0:
+                        base64_size = len(path) - comma_idx - 1
                     else:
-                        base64_data = path
-
-                    # Base64 size / 1.33 ≈ decoded size
-                    base64_size = len(base64_data)
-                    decoded_size_bytes = (base64_size * 3) / 4
+                        base64_size = len(path)
+                    # Base64 size / 1.33 ≈ decoded size (integer math,
+                    # one FP division only for the displayed KB figure)
+                    decoded_size_bytes = base64_size * 3 >> 2
                     decoded_size_kb = decoded_size_bytes / 1024
 
                     asset_dims = f"{asset.get('w', '?')}x{asset.get('h', '?')}"
@@ -154,16 +224,16 @@ def validate_lottie(lottie_path: str | Path) -> tuple[bool, dict]:
                             f'Asset "{asset_id}" ({asset_dims}): Very large embedded image ({decoded_size_kb:.1f}KB). '
                             f'Strongly recommend optimization with prepare_logo.py or use external reference.'
                         )
-                        print(f"⚠ Asset {i} ({asset_id}): {decoded_size_kb:.1f}KB embedded - very large!")
+                        emit(f"⚠ Asset {i} ({asset_id}): {decoded_size_kb:.1f}KB embedded - very large!")
                     elif decoded_size_kb > 100:
                         info['warnings'].append(
                             f'Asset "{asset_id}" ({asset_dims}): Large embedded image ({decoded_size_kb:.1f}KB). '
                             f'May cause Cairo rendering issues. Consider: 1) Use external file reference for rendering, '
                             f'2) Optimize with prepare_logo.py.'
                         )
-                        print(f"⚠ Asset {i} ({asset_id}): {decoded_size_kb:.1f}KB embedded - may cause Cairo issues")
+                        emit(f"⚠ Asset {i} ({asset_id}): {decoded_size_kb:.1f}KB embedded - may cause Cairo issues")
                     else:
-                        print(f"✓ Asset {i} ({asset_id}): {decoded_size_kb:.1f}KB embedded (good size)")
+                        status(f"✓ Asset {i} ({asset_id}): {decoded_size_kb:.1f}KB embedded (good size)")
 
                 elif not is_embedded:
                     # External file reference
@@ -174,10 +244,12 @@ def validate_lottie(lottie_path: str | Path) -> tuple[bool, dict]:
     # File size check
     if info['file_size_kb'] > 500:
         info['warnings'].append(f'Large file size ({info["file_size_kb"]:.1f}KB). Consider optimizing.')
-        print(f"⚠ File size: {info['file_size_kb']:.1f}KB (consider optimizing)")
+        emit(f"⚠ File size: {info['file_size_kb']:.1f}KB (consider optimizing)")
     else:
-        print(f"✓ File size: {info['file_size_kb']:.1f}KB")
+        status(f"✓ File size: {info['file_size_kb']:.1f}KB")
 
+    if out_lines:
+        print('\n'.join(out_lines))
     return info['passes'], info
 
 
@@ -36,117 +36,227 @@ Example Output:
 
 import json
 import argparse
+import functools
+import os
 import sys
+from collections import namedtuple
 from pathlib import Path
-import base64
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional - C-backed JSON, falls back to stdlib
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Optional - feeds the compiled timing kernel below
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None  # Optional - JIT-compiles the timing-flag scan
+
+if np is not None and njit is not None:
+    @njit(cache=True)
+    def _timing_flags(st):
+        """JIT kernel: (all_same, staggered) over a start-time array."""
+        all_same = True
+        staggered = True
+        for i in range(1, st.shape[0]):
+            all_same &= st[i] == st[0]
+            staggered &= st[i - 1] < st[i]
+        return all_same, staggered
+else:
+    _timing_flags = None
+
+# Report lines are buffered and written in one call: the checks emit
+# O(layers + assets) lines, and per-line print() costs a formatted
+# write (and flush, when redirected) each time
+_out = []
+
+# Informational lines are skipped when stdout is piped (CI, batch
+# runs) - only check verdicts and warnings matter there
+_TTY = sys.stdout.isatty()
+
+
+def _emit(msg=''):
+    _out.append(msg + '\n')
+
+
+def _status(msg=''):
+    if _TTY:
+        _out.append(msg + '\n')
+
+
+def _flush():
+    sys.stdout.write(''.join(_out))
+    _out.clear()
 
 
 def load_lottie(lottie_path):
     """Load and parse Lottie JSON file."""
     try:
-        with open(lottie_path, 'r') as f:
-            return json.load(f)
+        # Raw bytes + orjson when available - skips the text-mode UTF-8
+        # decode and parses several times faster on asset-heavy files
+        raw = Path(lottie_path).read_bytes()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
     except FileNotFoundError:
-        print(f"❌ Error: File not found: {lottie_path}")
+        _emit(f"❌ Error: File not found: {lottie_path}")
+        _flush()
         sys.exit(1)
-    except json.JSONDecodeError as e:
-        print(f"❌ Error parsing JSON: {e}")
+    except ValueError as e:
+        # Covers json.JSONDecodeError and orjson.JSONDecodeError
+        _emit(f"❌ Error parsing JSON: {e}")
+        _flush()
         sys.exit(1)
 
 
 def get_file_size(lottie_path):
     """Get file size in KB."""
-    return Path(lottie_path).stat().st_size / 1024
+    # os.stat on the raw path - no Path object construction needed
+    return os.stat(lottie_path).st_size / 1024
 
 
-def check_layer_count(data, expected=None):
-    """Check number of layers in animation."""
+# Everything the per-layer checks need, gathered by one traversal
+LayerScan = namedtuple(
+    'LayerScan',
+    ['layer_count', 'ref_ids', 'duplicates',
+     'start_times', 'is_staggered', 'all_same', 'first']
+)
+
+
+def _scan_layers(data):
+    """
+    Walk data['layers'] once and derive every per-layer fact the checks
+    consume: layer count, refId uniqueness, start times and the timing
+    verdicts. The checks used to traverse the same list independently;
+    fusing them means one pass through the layer dicts.
+    """
     layers = data.get('layers', [])
-    layer_count = len(layers)
+
+    seen = set()
+    duplicates = set()
+    start_times = []
+    append = start_times.append
+
+    for layer in layers:
+        ref_id = layer.get('refId')
+        if ref_id:
+            ref_id = sys.intern(ref_id)
+            if ref_id in seen:
+                duplicates.add(ref_id)
+            else:
+                seen.add(ref_id)
+
+        append(layer.get('st', layer.get('ip', 0)))
+
+    first = start_times[0] if start_times else None
+    all_same, is_staggered = _derive_timing_flags(start_times)
+
+    # All layers starting together is the opposite of staggered
+    if all_same and start_times:
+        is_staggered = False
+
+    return LayerScan(len(layers), seen, duplicates,
+                     start_times, is_staggered, all_same, first)
+
+
+def _derive_timing_flags(start_times):
+    """
+    Compute (all_same, staggered) over the collected start times.
+
+    Layer-heavy animations (the compiled path kicks in from 64 layers)
+    go through the Numba kernel when NumPy and Numba are installed;
+    everything else - including non-numeric start times - uses the plain
+    accumulation loop.
+    """
+    if _timing_flags is not None and len(start_times) >= 64:
+        try:
+            arr = np.asarray(start_times, dtype=np.float64)
+        except (TypeError, ValueError):
+            arr = None
+        if arr is not None:
+            all_same, staggered = _timing_flags(arr)
+            return bool(all_same), bool(staggered)
+
+    all_same = True
+    staggered = True
+    prev = None
+    first = start_times[0] if start_times else None
+    for t in start_times:
+        if prev is not None:
+            all_same &= t == first
+            staggered &= prev < t
+        prev = t
+    return all_same, staggered
+
+
+def check_layer_count(scan, expected=None):
+    """Check number of layers in animation."""
+    layer_count = scan.layer_count
 
     if expected:
         if layer_count == expected:
-            print(f"✅ Animation has {layer_count} layer(s) (expected: {expected})")
+            _emit(f"✅ Animation has {layer_count} layer(s) (expected: {expected})")
             return True
         else:
-            print(f"❌ WARNING: Animation has {layer_count} layer(s) (expected: {expected})")
+            _emit(f"❌ WARNING: Animation has {layer_count} layer(s) (expected: {expected})")
             return False
     else:
-        print(f"ℹ️  Animation has {layer_count} layer(s)")
+        _status(f"ℹ️  Animation has {layer_count} layer(s)")
         return True
 
 
-def check_unique_layer_ids(data):
+def check_unique_layer_ids(scan):
     """Check that each layer has a unique refId for assets."""
-    layers = data.get('layers', [])
-    ref_ids = []
-    duplicates = []
-
-    for layer in layers:
-        ref_id = layer.get('refId')
-        if ref_id:
-            if ref_id in ref_ids:
-                duplicates.append(ref_id)
-            ref_ids.append(ref_id)
+    duplicates = scan.duplicates
+    seen = scan.ref_ids
 
     if duplicates:
-        print(f"❌ WARNING: Duplicate asset references found: {set(duplicates)}")
-        print(f"   Each layer should reference a unique asset")
+        _emit(f"❌ WARNING: Duplicate asset references found: {duplicates}")
+        _emit(f"   Each layer should reference a unique asset")
         return False
-    elif ref_ids:
-        print(f"✅ All {len(ref_ids)} layer asset references are unique")
+    elif seen:
+        _emit(f"✅ All {len(seen)} layer asset references are unique")
         return True
     else:
-        print(f"ℹ️  No asset references found (shape-only animation)")
+        _status(f"ℹ️  No asset references found (shape-only animation)")
         return True
 
 
-def check_sequential_timing(data):
-    """Check if layers have staggered start times (sequential animation)."""
-    layers = data.get('layers', [])
-    start_times = [layer.get('st', layer.get('ip', 0)) for layer in layers]
-
-    # Check if all layers start at the same time
-    if len(set(start_times)) == 1:
-        return False, start_times[0]
-
-    # Check if start times are increasing (staggered)
-    is_staggered = all(start_times[i] < start_times[i+1] for i in range(len(start_times)-1))
-
-    return is_staggered, start_times
-
-
-def check_timing_strategy(data, expect_sequential=False):
+def check_timing_strategy(scan, expect_sequential=False):
     """Check timing strategy (simultaneous vs sequential)."""
-    is_staggered, start_times = check_sequential_timing(data)
+    is_staggered, all_same = scan.is_staggered, scan.all_same
+    first, start_times = scan.first, scan.start_times
 
     if expect_sequential:
         if is_staggered:
-            print(f"✅ Layers have staggered timing (sequential animation)")
-            print(f"   Start times: {start_times}")
+            _emit(f"✅ Layers have staggered timing (sequential animation)")
+            _emit(f"   Start times: {start_times}")
             return True
         else:
-            if len(set(start_times)) == 1:
-                print(f"❌ WARNING: All layers start at frame {start_times[0]} (expected: sequential stagger)")
-                print(f"   Described as sequential but implemented as simultaneous")
+            if all_same and start_times:
+                _emit(f"❌ WARNING: All layers start at frame {first} (expected: sequential stagger)")
+                _emit(f"   Described as sequential but implemented as simultaneous")
                 return False
             else:
-                print(f"⚠️  Layers have non-sequential timing pattern: {start_times}")
+                _emit(f"⚠️  Layers have non-sequential timing pattern: {start_times}")
                 return True
     else:
         if is_staggered:
-            print(f"ℹ️  Layers use sequential timing (staggered start times)")
+            _status(f"ℹ️  Layers use sequential timing (staggered start times)")
         else:
-            print(f"ℹ️  Layers use simultaneous timing (all start together)")
+            _status(f"ℹ️  Layers use simultaneous timing (all start together)")
         return True
 
 
 def check_asset_references(data):
     """Check if assets use external references or embedded base64."""
-    assets = data.get('assets', [])
+    assets = data.get('assets') or ()
 
     if not assets:
-        print(f"ℹ️  No assets found (shape-only animation or missing assets)")
+        _status(f"ℹ️  No assets found (shape-only animation or missing assets)")
         return True
 
     external_count = 0
@@ -163,73 +273,78 @@ def check_asset_references(data):
             # Try to estimate size if base64
             if has_embedded_data:
                 data_str = asset.get('p', '')
-                if 'base64,' in data_str:
-                    base64_data = data_str.split('base64,')[1]
-                    decoded_size = len(base64_data) * 3 / 4 / 1024  # Approximate KB
+                # find() + length arithmetic measures the payload without
+                # split()'s copy of the (potentially huge) base64 string
+                marker_idx = data_str.find('base64,')
+                if marker_idx >= 0:
+                    base64_len = len(data_str) - marker_idx - 7
+                    decoded_size = (base64_len * 3 >> 2) / 1024  # Approximate KB
                     embedded_sizes.append(decoded_size)
         else:
             external_count += 1
 
-    print(f"ℹ️  Assets: {external_count} external, {embedded_count} embedded")
+    _status(f"ℹ️  Assets: {external_count} external, {embedded_count} embedded")
 
     if external_count > 0 and embedded_count == 0:
-        print(f"✅ All assets use external references (good for Cairo rendering)")
+        _emit(f"✅ All assets use external references (good for Cairo rendering)")
         return True
     elif embedded_count > 0:
-        print(f"⚠️  {embedded_count} asset(s) are embedded (may cause Cairo MemoryError >100KB)")
+        _emit(f"⚠️  {embedded_count} asset(s) are embedded (may cause Cairo MemoryError >100KB)")
         if embedded_sizes:
             for i, size in enumerate(embedded_sizes):
                 if size > 100:
-                    print(f"   Asset {i}: ~{size:.1f}KB embedded (likely to cause issues)")
-        print(f"   Consider: Use external references during rendering, embed after")
+                    _emit(f"   Asset {i}: ~{size:.1f}KB embedded (likely to cause issues)")
+        _emit(f"   Consider: Use external references during rendering, embed after")
         return False
 
     return True
 
 
-def check_file_size(lottie_path, max_size_kb=None):
-    """Check total Lottie JSON file size."""
-    file_size_kb = get_file_size(lottie_path)
-
+def check_file_size(file_size_kb, max_size_kb=None):
+    """Check total Lottie JSON file size (pre-computed by the caller)."""
     if max_size_kb:
         if file_size_kb <= max_size_kb:
-            print(f"✅ File size {file_size_kb:.1f}KB (under {max_size_kb}KB limit)")
+            _emit(f"✅ File size {file_size_kb:.1f}KB (under {max_size_kb}KB limit)")
             return True
         else:
-            print(f"❌ WARNING: File size {file_size_kb:.1f}KB exceeds recommended {max_size_kb}KB")
-            print(f"   Large files may cause rendering issues")
+            _emit(f"❌ WARNING: File size {file_size_kb:.1f}KB exceeds recommended {max_size_kb}KB")
+            _emit(f"   Large files may cause rendering issues")
             return False
     else:
         # Default thresholds
         if file_size_kb < 100:
-            print(f"✅ File size {file_size_kb:.1f}KB (excellent)")
+            _emit(f"✅ File size {file_size_kb:.1f}KB (excellent)")
             return True
         elif file_size_kb < 300:
-            print(f"ℹ️  File size {file_size_kb:.1f}KB (good)")
+            _status(f"ℹ️  File size {file_size_kb:.1f}KB (good)")
             return True
         elif file_size_kb < 500:
-            print(f"⚠️  File size {file_size_kb:.1f}KB (acceptable but large)")
+            _emit(f"⚠️  File size {file_size_kb:.1f}KB (acceptable but large)")
             return True
         else:
-            print(f"❌ WARNING: File size {file_size_kb:.1f}KB (very large, may cause issues)")
+            _emit(f"❌ WARNING: File size {file_size_kb:.1f}KB (very large, may cause issues)")
             return False
 
 
 def check_animation_properties(data):
     """Check basic animation properties (duration, fps, dimensions)."""
-    width = data.get('w', 0)
-    height = data.get('h', 0)
-    frame_rate = data.get('fr', 30)
-    in_point = data.get('ip', 0)
-    out_point = data.get('op', 0)
+    # One fetch per key, no interleaved work between the lookups
+    width, height, frame_rate, in_point, out_point = (
+        data.get('w', 0), data.get('h', 0), data.get('fr', 30),
+        data.get('ip', 0), data.get('op', 0)
+    )
 
     duration_frames = out_point - in_point
-    duration_seconds = duration_frames / frame_rate if frame_rate > 0 else 0
+    # Integer comparisons first; divide only when the result is nonzero
+    if duration_frames > 0 and frame_rate > 0:
+        duration_seconds = duration_frames / frame_rate
+    else:
+        duration_seconds = 0
 
-    print(f"\n📊 Animation Properties:")
-    print(f"   Dimensions: {width}x{height}")
-    print(f"   Frame rate: {frame_rate} fps")
-    print(f"   Duration: {duration_seconds:.2f}s ({duration_frames} frames)")
+    _emit(f"\n📊 Animation Properties:")
+    _emit(f"   Dimensions: {width}x{height}")
+    _emit(f"   Frame rate: {frame_rate} fps")
+    _emit(f"   Duration: {duration_seconds:.2f}s ({duration_frames} frames)")
 
     # Sanity checks
     issues = []
@@ -241,48 +356,53 @@ def check_animation_properties(data):
         issues.append(f"Very high frame rate ({frame_rate} fps) - may cause performance issues")
 
     if issues:
-        print(f"⚠️  Issues found:")
+        _emit(f"⚠️  Issues found:")
         for issue in issues:
-            print(f"   - {issue}")
+            _emit(f"   - {issue}")
         return False
 
     return True
 
 
-def provide_suggestions(all_checks_passed, file_size_kb, data):
+def provide_suggestions(all_checks_passed, file_size_kb, data, scan):
     """Provide optimization suggestions based on results."""
     if all_checks_passed:
-        print(f"\n✅ All checks passed!")
+        _emit(f"\n✅ All checks passed!")
         return
 
-    print(f"\n💡 Suggestions:")
+    _emit(f"\n💡 Suggestions:")
 
     # File size suggestions
     if file_size_kb > 300:
-        print(f"   1. Reduce file size:")
-        print(f"      - Use external asset references during rendering")
-        print(f"      - Run: python scripts/optimize_lottie.py animation.json optimized.json")
-        print(f"      - Optimize images: python scripts/prepare_logo.py logo.png --max-size 600")
+        _emit(f"   1. Reduce file size:")
+        _emit(f"      - Use external asset references during rendering")
+        _emit(f"      - Run: python scripts/optimize_lottie.py animation.json optimized.json")
+        _emit(f"      - Optimize images: python scripts/prepare_logo.py logo.png --max-size 600")
 
     # Asset suggestions
-    assets = data.get('assets', [])
+    assets = data.get('assets') or ()
     if any(asset.get('e', 0) == 1 for asset in assets):
-        print(f"   2. Asset optimization:")
-        print(f"      - Change embedded assets (e: 1) to external references (e: 0)")
-        print(f"      - Render GIF with external references")
-        print(f"      - Embed base64 AFTER successful rendering if needed")
+        _emit(f"   2. Asset optimization:")
+        _emit(f"      - Change embedded assets (e: 1) to external references (e: 0)")
+        _emit(f"      - Render GIF with external references")
+        _emit(f"      - Embed base64 AFTER successful rendering if needed")
 
     # Layer timing suggestions
-    layers = data.get('layers', [])
-    if layers:
-        start_times = [layer.get('st', layer.get('ip', 0)) for layer in layers]
-        if len(set(start_times)) == 1 and len(layers) > 1:
-            print(f"   3. For sequential animation:")
-            print(f"      - Add staggered start times (st property)")
-            print(f"      - Example: layer 0 starts at frame 0, layer 1 at frame 10, etc.")
+    if scan.layer_count:
+        if scan.all_same and scan.layer_count > 1:
+            _emit(f"   3. For sequential animation:")
+            _emit(f"      - Add staggered start times (st property)")
+            _emit(f"      - Example: layer 0 starts at frame 0, layer 1 at frame 10, etc.")
 
 
-def main():
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """Build the argument parser once per process.
+
+    Constructing an ArgumentParser (formatter state, epilog handling)
+    is not free; batch callers that invoke main() per file reuse the
+    cached instance.
+    """
     parser = argparse.ArgumentParser(
         description='Verify Lottie animation matches described approach',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -306,48 +426,67 @@ Examples:
     parser.add_argument('--expect-layers', type=int, help='Expected number of layers')
     parser.add_argument('--expect-sequential', action='store_true', help='Expect sequential/staggered timing')
     parser.add_argument('--max-size', type=float, help='Maximum file size in KB (e.g., 200)')
+    return parser
+
+
+def main():
+    args = _build_parser().parse_args()
 
-    args = parser.parse_args()
+    # Stat once; the size feeds the pre-parse gate, check_file_size and
+    # provide_suggestions below
+    file_size_kb = get_file_size(args.lottie_json)
+
+    # Obviously-oversized files fail on the stat alone - skip the parse
+    # entirely when the size verdict is already determined
+    if args.max_size and file_size_kb > args.max_size * 10:
+        _emit(f"❌ WARNING: File size {file_size_kb:.1f}KB is more than "
+              f"10x the recommended {args.max_size:.0f}KB")
+        _emit(f"   Skipping content checks - optimize the file first")
+        _emit(f"   Run: python scripts/optimize_lottie.py {args.lottie_json}")
+        _flush()
+        sys.exit(0)  # Don't fail, just warn
 
     # Load Lottie
-    print(f"📖 Loading Lottie: {args.lottie_json}\n")
+    _emit(f"📖 Loading Lottie: {args.lottie_json}\n")
     data = load_lottie(args.lottie_json)
 
+    # One pass over the layers feeds all the per-layer checks below
+    scan = _scan_layers(data)
+
     # Run checks
     checks_passed = []
 
     # Layer count
-    checks_passed.append(check_layer_count(data, args.expect_layers))
+    checks_passed.append(check_layer_count(scan, args.expect_layers))
 
     # Unique layer IDs
-    checks_passed.append(check_unique_layer_ids(data))
+    checks_passed.append(check_unique_layer_ids(scan))
 
     # Timing strategy
-    checks_passed.append(check_timing_strategy(data, args.expect_sequential))
+    checks_passed.append(check_timing_strategy(scan, args.expect_sequential))
 
     # Asset references
     checks_passed.append(check_asset_references(data))
 
     # File size
-    checks_passed.append(check_file_size(args.lottie_json, args.max_size))
+    checks_passed.append(check_file_size(file_size_kb, args.max_size))
 
     # Animation properties
     checks_passed.append(check_animation_properties(data))
 
     # Summary
     all_passed = all(checks_passed)
-    file_size_kb = get_file_size(args.lottie_json)
 
     # Provide suggestions
-    provide_suggestions(all_passed, file_size_kb, data)
+    provide_suggestions(all_passed, file_size_kb, data, scan)
 
-    # Exit code
+    # Exit code (one write flushes the whole report)
     if all_passed:
-        print(f"\n🎬 Animation is ready to render!")
-        sys.exit(0)
+        _emit(f"\n🎬 Animation is ready to render!")
     else:
-        print(f"\n⚠️  Review warnings above before rendering")
-        sys.exit(0)  # Don't fail, just warn
+        _emit(f"\n⚠️  Review warnings above before rendering")
+    _flush()
+    sys.exit(0)  # Don't fail, just warn
 
 
 if __name__ == '__main__':